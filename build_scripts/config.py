@@ -7,7 +7,43 @@ from .log import log, LogLevel
 from pathlib import Path
 
 from . import PYSIDE, PYSIDE_MODULE, SHIBOKEN
-from .utils import available_pyside_tools
+
+_SHIBOKEN_GENERATOR = f"{SHIBOKEN}-generator"
+_SHIBOKEN_GENERATOR_PKG = f"{SHIBOKEN}_generator"
+
+_PYTHON_VERSION_CLASSIFIERS = (
+    'Programming Language :: Python',
+    'Programming Language :: Python :: 3',
+    'Programming Language :: Python :: 3.9',
+    'Programming Language :: Python :: 3.10',
+    'Programming Language :: Python :: 3.11',
+    'Programming Language :: Python :: 3.12',
+    'Programming Language :: Python :: 3.13',
+)
+
+_COMMON_CLASSIFIERS = (
+    'Development Status :: 5 - Production/Stable',
+    'Environment :: Console',
+    'Environment :: MacOS X',
+    'Environment :: X11 Applications :: Qt',
+    'Environment :: Win32 (MS Windows)',
+    'Intended Audience :: Developers',
+    'License :: OSI Approved :: GNU Library or Lesser General Public License (LGPL)',
+    'License :: Other/Proprietary License',
+    'Operating System :: MacOS :: MacOS X',
+    'Operating System :: POSIX',
+    'Operating System :: POSIX :: Linux',
+    'Operating System :: Microsoft',
+    'Operating System :: Microsoft :: Windows',
+    'Programming Language :: C++',
+    *_PYTHON_VERSION_CLASSIFIERS,
+    'Topic :: Database',
+    'Topic :: Software Development',
+    'Topic :: Software Development :: Code Generators',
+    'Topic :: Software Development :: Libraries :: Application Frameworks',
+    'Topic :: Software Development :: User Interfaces',
+    'Topic :: Software Development :: Widget Sets',
+)
 
 
 class Config(object):
@@ -37,17 +73,23 @@ class Config(object):
         # setup.py to build a specific module only.
         self.internal_build_type = None
 
+        # Derived from internal_build_type by set_internal_build_type().
+        self._is_shiboken_module = False
+        self._is_shiboken_generator = False
+        self._is_pyside = False
+        self._package_name = None
+
         # Options that can be given to --build-type and
         # --internal-build-type
         self.shiboken_module_option_name = SHIBOKEN
-        self.shiboken_generator_option_name = f"{SHIBOKEN}-generator"
+        self.shiboken_generator_option_name = _SHIBOKEN_GENERATOR
         self.pyside_option_name = PYSIDE
 
         # Names to be passed to setuptools.setup() name key,
         # so not package name, but rather project name as it appears
         # in the wheel name and on PyPi.
         self.shiboken_module_st_name = SHIBOKEN
-        self.shiboken_generator_st_name = f"{SHIBOKEN}-generator"
+        self.shiboken_generator_st_name = _SHIBOKEN_GENERATOR
         self.pyside_st_name = PYSIDE_MODULE
 
         # Path to CMake toolchain file when intending to cross compile
@@ -59,18 +101,14 @@ class Config(object):
 
         # Used by check_allowed_python_version to validate the
         # interpreter version.
-        self.python_version_classifiers = [
-            'Programming Language :: Python',
-            'Programming Language :: Python :: 3',
-            'Programming Language :: Python :: 3.9',
-            'Programming Language :: Python :: 3.10',
-            'Programming Language :: Python :: 3.11',
-            'Programming Language :: Python :: 3.12',
-            'Programming Language :: Python :: 3.13',
-        ]
+        self.python_version_classifiers = _PYTHON_VERSION_CLASSIFIERS
 
         self.setup_script_dir = None
 
+        # Contents of the README files, keyed by internal build type and
+        # setup script directory.
+        self._long_description_cache = {}
+
     def init_config(self,
                     build_type=None,
                     internal_build_type=None,
@@ -105,19 +143,13 @@ class Config(object):
 
         self.cmake_toolchain_file = cmake_toolchain_file
 
-        setup_kwargs = {}
-        setup_kwargs['long_description'] = self.get_long_description()
-        setup_kwargs['long_description_content_type'] = 'text/markdown'
-        setup_kwargs['keywords'] = 'Qt'
-        setup_kwargs['author'] = 'Qt for Python Team'
-        setup_kwargs['author_email'] = 'pyside@qt-project.org'
-        setup_kwargs['url'] = 'https://www.pyside.org'
-        setup_kwargs['download_url'] = 'https://download.qt.io/official_releases/QtForPython'
-        setup_kwargs['license'] = 'LGPL'
-        setup_kwargs['zip_safe'] = False
-        setup_kwargs['cmdclass'] = cmd_class_dict
-        setup_kwargs['version'] = package_version
-        setup_kwargs['python_requires'] = ">=3.9, <3.14"
+        # The static metadata (author, urls, license, python_requires, ...)
+        # is declared in setup.cfg.
+        setup_kwargs = {
+            'long_description': self.get_long_description(),
+            'cmdclass': cmd_class_dict,
+            'version': package_version,
+        }
 
         if log_level == LogLevel.QUIET:
             # Tells setuptools to be quiet, and only print warnings or errors.
@@ -149,30 +181,7 @@ class Config(object):
         # modules and will name the dist with the full platform info.
         setup_kwargs['ext_modules'] = ext_modules
 
-        common_classifiers = [
-            'Development Status :: 5 - Production/Stable',
-            'Environment :: Console',
-            'Environment :: MacOS X',
-            'Environment :: X11 Applications :: Qt',
-            'Environment :: Win32 (MS Windows)',
-            'Intended Audience :: Developers',
-            'License :: OSI Approved :: GNU Library or Lesser General Public License (LGPL)',
-            'License :: Other/Proprietary License',
-            'Operating System :: MacOS :: MacOS X',
-            'Operating System :: POSIX',
-            'Operating System :: POSIX :: Linux',
-            'Operating System :: Microsoft',
-            'Operating System :: Microsoft :: Windows',
-            'Programming Language :: C++']
-        common_classifiers.extend(self.python_version_classifiers)
-        common_classifiers.extend([
-            'Topic :: Database',
-            'Topic :: Software Development',
-            'Topic :: Software Development :: Code Generators',
-            'Topic :: Software Development :: Libraries :: Application Frameworks',
-            'Topic :: Software Development :: User Interfaces',
-            'Topic :: Software Development :: Widget Sets'])
-        setup_kwargs['classifiers'] = common_classifiers
+        setup_kwargs['classifiers'] = list(_COMMON_CLASSIFIERS)
 
         package_name = self.package_name()
 
@@ -202,6 +211,8 @@ class Config(object):
                 f"{self.shiboken_module_st_name}=={package_version}"
             ]
             if qt_install_path:
+                # Deferred since utils is only needed for the tool discovery
+                from .utils import available_pyside_tools
                 _pyside_tools = available_pyside_tools(qt_tools_path=qt_install_path)
 
                 # replacing pyside6-android_deploy by pyside6-android-deploy for consistency
@@ -210,52 +221,43 @@ class Config(object):
                 if ("android_deploy" in _pyside_tools) and sys.platform in ["linux", "darwin"]:
                     _console_scripts = [(f"{PYSIDE}-android-deploy ="
                                         " PySide6.scripts.pyside_tool:android_deploy")]
-                _pyside_tools.remove("android_deploy")
 
-                _console_scripts.extend([f'{PYSIDE}-{tool} = {package_name}.scripts.pyside_tool:'
-                                         f'{tool}' for tool in _pyside_tools])
+                _script_prefix = f"{PYSIDE}-"
+                _script_target = f" = {package_name}.scripts.pyside_tool:"
+                _console_scripts.extend([_script_prefix + tool + _script_target + tool
+                                         for tool in _pyside_tools
+                                         if tool != "android_deploy"])
 
                 setup_kwargs['entry_points'] = {'console_scripts': _console_scripts}
 
         self.setup_kwargs = setup_kwargs
 
     def get_long_description(self):
+        key = (self.internal_build_type, self.setup_script_dir)
+        content = self._long_description_cache.get(key)
+        if content is None:
+            content = self._read_long_description()
+            self._long_description_cache[key] = content
+        return content
+
+    def _read_long_description(self):
         readme_filename = 'README.md'
-        changes_filename = 'CHANGES.rst'
 
         if self.is_internal_shiboken_module_build():
             readme_filename = f'README.{SHIBOKEN}.md'
         elif self.is_internal_shiboken_generator_build():
-            readme_filename = f'README.{SHIBOKEN}-generator.md'
+            readme_filename = f'README.{_SHIBOKEN_GENERATOR}.md'
         elif self.is_internal_pyside_build():
             readme_filename = f'README.{PYSIDE}.md'
 
-        content = ''
-        changes = ''
+        # CHANGES.rst is not included for now, because we have not decided
+        # how to handle change files yet.
         try:
-            with open(self.setup_script_dir / readme_filename) as f:
-                readme = f.read()
+            return (self.setup_script_dir / readme_filename).read_text(encoding="utf-8")
         except Exception as e:
             log.error(f"Couldn't read contents of {readme_filename}. {e}")
             raise
 
-        # Don't include CHANGES.rst for now, because we have not decided
-        # how to handle change files yet.
-        include_changes = False
-        if include_changes:
-            try:
-                with open(self.setup_script_dir / changes_filename) as f:
-                    changes = f.read()
-            except Exception as e:
-                log.error(f"Couldn't read contents of {changes_filename}. {e}")
-                raise
-        content += readme
-
-        if changes:
-            content += f"\n\n{changes}"
-
-        return content
-
     def package_name(self):
         """
         Returns package name as it appears in Python's site-packages
@@ -264,14 +266,7 @@ class Config(object):
         Package names can only be delimited by underscores, and not by
         dashes.
         """
-        if self.is_internal_shiboken_module_build():
-            return SHIBOKEN
-        elif self.is_internal_shiboken_generator_build():
-            return f"{SHIBOKEN}_generator"
-        elif self.is_internal_pyside_build():
-            return PYSIDE_MODULE
-        else:
-            return None
+        return self._package_name
 
     def get_setup_tools_packages_for_current_build(self):
         """
@@ -363,15 +358,27 @@ class Config(object):
 
     def set_internal_build_type(self, internal_build_type):
         self.internal_build_type = internal_build_type
+        self._is_shiboken_module = internal_build_type == self.shiboken_module_option_name
+        self._is_shiboken_generator = internal_build_type == self.shiboken_generator_option_name
+        self._is_pyside = internal_build_type == self.pyside_option_name
+
+        if self._is_shiboken_module:
+            self._package_name = SHIBOKEN
+        elif self._is_shiboken_generator:
+            self._package_name = _SHIBOKEN_GENERATOR_PKG
+        elif self._is_pyside:
+            self._package_name = PYSIDE_MODULE
+        else:
+            self._package_name = None
 
     def is_internal_shiboken_module_build(self):
-        return self.internal_build_type == self.shiboken_module_option_name
+        return self._is_shiboken_module
 
     def is_internal_shiboken_generator_build(self):
-        return self.internal_build_type == self.shiboken_generator_option_name
+        return self._is_shiboken_generator
 
     def is_internal_pyside_build(self):
-        return self.internal_build_type == self.pyside_option_name
+        return self._is_pyside
 
     def is_internal_shiboken_generator_build_and_part_of_top_level_all(self):
         """
@@ -47,16 +47,53 @@ class Options(object):
         # Dictionary containing values of all the possible options.
         self.dict = {}
 
+        # Immutable snapshot of sys.argv taken on first access. Options are
+        # looked up in the snapshot; sys.argv itself is only replaced by
+        # flush().
+        self._argv = None
+        # Index of the snapshot arguments starting with "-", mapping the
+        # option name (the part before an optional "=") to a list of
+        # (position, inline value) tuples.
+        self._argv_index = None
+        # Positions of the snapshot arguments consumed by has_option() and
+        # option_value().
+        self._pending_removals = set()
+
+    def _index(self):
+        if self._argv_index is None:
+            self._argv = tuple(sys.argv)
+            index = {}
+            # The script name is never an option.
+            for position, arg in enumerate(self._argv[1:], 1):
+                if arg.startswith("-"):
+                    name, sep, value = arg.partition("=")
+                    index.setdefault(name, []).append((position, value if sep else None))
+            self._argv_index = index
+        return self._argv_index
+
+    def _occurrences(self, option):
+        pending = self._pending_removals
+        return [entry for entry in self._index().get(option, ()) if entry[0] not in pending]
+
+    def flush(self):
+        """ Sets sys.argv to the snapshot without the arguments consumed
+        by has_option() and option_value(). """
+        if self._pending_removals:
+            pending = self._pending_removals
+            sys.argv = [arg for position, arg in enumerate(self._argv)
+                        if position not in pending]
+            pending.clear()
+        self._argv = None
+        self._argv_index = None
+
     def has_option(self, name, remove=True):
         """ Returns True if argument '--name' was passed on the command
         line. """
         option = f"--{name}"
-        count = sys.argv.count(option)
-        remove_count = count
-        if not remove and count > 0:
-            remove_count -= 1
-        for _ in range(remove_count):
-            sys.argv.remove(option)
+        positions = [position for position, value in self._occurrences(option)
+                     if value is None]
+        count = len(positions)
+        self._pending_removals.update(positions if remove else positions[:-1])
         if count > 1:
             _warn_multiple_option(option)
         return count > 0
@@ -75,30 +112,33 @@ class Options(object):
         """
 
         option = f"--{name}"
-        short_option = f"-{short_option_name}" if short_option_name else None
-        single_option_prefix = f"{option}="
+        occurrences = self._occurrences(option)
+        if short_option_name:
+            occurrences += [(position, None)
+                            for position, value in self._occurrences(f"-{short_option_name}")
+                            if value is None]
+        argv = self._argv
+        argc = len(argv)
         value = None
-        for index in reversed(range(len(sys.argv))):
-            arg = sys.argv[index]
-            if arg == option or short_option and arg == short_option:
-                if value:
-                    _warn_multiple_option(option)
-                else:
-                    if index + 1 >= len(sys.argv):
-                        raise RuntimeError(f"The option {option} requires a value")
-                    value = sys.argv[index + 1]
-
-                if remove:
-                    sys.argv[index:index + 2] = []
-
-            elif arg.startswith(single_option_prefix):
-                if value:
-                    _warn_multiple_option(option)
-                else:
-                    value = arg[len(single_option_prefix):]
-
-                if remove:
-                    sys.argv[index:index + 1] = []
+        for position, inline_value in sorted(occurrences, reverse=True):
+            if value:
+                _warn_multiple_option(option)
+            elif inline_value is not None:
+                value = inline_value
+            else:
+                # The value is the next argument which was not consumed by
+                # an earlier call, as if those were already gone from sys.argv.
+                value_position = position + 1
+                while value_position in self._pending_removals:
+                    value_position += 1
+                if value_position >= argc:
+                    raise RuntimeError(f"The option {option} requires a value")
+                value = argv[value_position]
+
+            if remove:
+                self._pending_removals.add(position)
+                if inline_value is None:
+                    self._pending_removals.add(value_position)
 
         self.dict[name] = value
         return value
@@ -184,6 +224,9 @@ if _deprecated_option_jobs:
     _warn_deprecated_option('jobs', 'parallel')
     OPTION["JOBS"] = _deprecated_option_jobs
 
+# Drop the consumed options from sys.argv before setuptools parses it.
+options.flush()
+
 
 class CommandMixin(object):
     """Mixin for the setuptools build/install commands handling the options."""
@@ -1127,6 +1127,13 @@ def parse_cmake_project_message_info(output):
 
 
 def available_pyside_tools(qt_tools_path: Path, package_for_wheels: bool = False):
+    """Returns a list of the tools available for the Qt installation. The
+    result is cached since this probes the file system."""
+    return list(_available_pyside_tools(qt_tools_path, package_for_wheels))
+
+
+@memoize
+def _available_pyside_tools(qt_tools_path: Path, package_for_wheels: bool):
     pyside_tools = PYSIDE_PYTHON_TOOLS.copy()
 
     if package_for_wheels:
@@ -1135,8 +1142,28 @@ def available_pyside_tools(qt_tools_path: Path, package_for_wheels: bool = False
     else:
         bin_path = qt_tools_path / "bin"
 
+    # Names of the existing entries of the directories probed, each directory
+    # is listed once instead of querying every tool path. Like Path.exists(),
+    # is_file()/is_dir() follow symlinks, so dangling ones are left out.
+    dir_entries = {}
+
+    def existing_entries(it):
+        return {os.path.normcase(entry.name) for entry in it
+                if entry.is_file() or entry.is_dir()}
+
     def tool_exist(tool_path: Path):
-        if tool_path.exists():
+        directory = tool_path.parent
+        entries = dir_entries.get(directory)
+        if entries is None:
+            try:
+                with os.scandir(directory) as it:
+                    entries = existing_entries(it)
+            except OSError:
+                entries = set()
+            dir_entries[directory] = entries
+        # Fall back to the file system when the name is not listed, for
+        # example on case-insensitive file systems.
+        if os.path.normcase(tool_path.name) in entries or tool_path.exists():
             return True
         else:
             log.warning(f"{tool_path} not found. pyside-{tool_path.name} not included.")
@@ -1162,7 +1189,7 @@ def available_pyside_tools(qt_tools_path: Path, package_for_wheels: bool = False
             pyside_tools.extend([tool for tool in PYSIDE_LINUX_BIN_TOOLS
                                 if tool_exist(bin_path / tool)])
 
-    return pyside_tools
+    return tuple(pyside_tools)
 
 
 def copy_qt_metatypes(destination_qt_dir, _vars):
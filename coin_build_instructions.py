@@ -10,7 +10,7 @@ import site
 import sys
 
 from build_scripts.log import log
-from build_scripts.options import has_option, option_value
+from build_scripts.options import has_option, option_value, options
 from build_scripts.utils import (expand_clang_variables, get_ci_qtpaths_path,
                                  get_qtci_virtualEnv,
                                  parse_cmake_conf_assignments_by_key,
@@ -40,6 +40,9 @@ CI_RELEASE_CONF = has_option("packaging")
 CI_TEST_PHASE = option_value("phase")
 if CI_TEST_PHASE not in ["ALL", "BUILD"]:
     CI_TEST_PHASE = "ALL"
+# The options module flushed sys.argv when it was imported, drop the
+# options consumed above as well.
+options.flush()
 
 
 def get_current_script_path():
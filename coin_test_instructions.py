@@ -7,7 +7,7 @@ import site
 import sys
 
 from build_scripts.log import log
-from build_scripts.options import has_option, option_value
+from build_scripts.options import has_option, option_value, options
 from build_scripts.utils import (expand_clang_variables, get_ci_qmake_path,
                                  get_qtci_virtualEnv, remove_tree, run_instruction)
 
@@ -28,6 +28,9 @@ if _ci_features is not None:
     for f in _ci_features.split(', '):
         CI_FEATURES.append(f)
 CI_RELEASE_CONF = has_option("packaging")
+# The options module flushed sys.argv when it was imported, drop the
+# options consumed above as well.
+options.flush()
 
 
 def call_testrunner(python_ver, buildnro):
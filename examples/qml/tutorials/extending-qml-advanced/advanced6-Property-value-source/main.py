@@ -9,46 +9,52 @@ from __future__ import annotations
 from pathlib import Path
 import sys
 
-from PySide6.QtCore import QCoreApplication
-from PySide6.QtQml import QQmlComponent, QQmlEngine, qmlAttachedPropertiesObject
-
-from person import Boy, Girl  # noqa: F401
-from birthdayparty import BirthdayParty
-from happybirthdaysong import HappyBirthdaySong  # noqa: F401
-
-
-app = QCoreApplication(sys.argv)
-engine = QQmlEngine()
-engine.addImportPath(Path(__file__).parent)
-component = QQmlComponent(engine)
-component.loadFromModule("People", "Main")
-party = component.create()
-if not party:
-    print(component.errors())
+IMPORT_PATH = str(Path(__file__).parent)
+
+
+def main():
+    from PySide6.QtCore import QCoreApplication
+    from PySide6.QtQml import QQmlComponent, QQmlEngine, qmlAttachedPropertiesObject
+
+    from person import Boy, Girl
+    from birthdayparty import BirthdayParty
+    from happybirthdaysong import HappyBirthdaySong  # noqa: F401
+
+    app = QCoreApplication([sys.argv[0]])
+    engine = QQmlEngine()
+    engine.addImportPath(IMPORT_PATH)
+    component = QQmlComponent(engine)
+    component.loadFromModule("People", "Main")
+    party = component.create()
+    if not party:
+        print(component.errors())
+        del engine
+        return -1
+    host = party.host
+    print(f"{host.name} is having a birthday!")
+    pronouns = {Boy: "He", Girl: "She"}
+    print(f"{pronouns.get(type(host), 'She')} is inviting:")
+    guest_at = party.guest
+    for g in range(party.guestCount()):
+        guest = guest_at(g)
+        name = guest.name
+
+        rsvp_date = None
+        attached = qmlAttachedPropertiesObject(BirthdayParty, guest, False)
+        if attached:
+            rsvp_date = attached.rsvp.toString()
+        if rsvp_date:
+            print(f"    {name} RSVP date: {rsvp_date}")
+        else:
+            print(f"    {name} RSVP date: Hasn't RSVP'd")
+
+    party.startParty()
+
+    r = app.exec()
+
     del engine
-    sys.exit(-1)
-host = party.host
-print(f"{host.name} is having a birthday!")
-if isinstance(host, Boy):
-    print("He is inviting:")
-else:
-    print("She is inviting:")
-for g in range(party.guestCount()):
-    guest = party.guest(g)
-    name = guest.name
-
-    rsvp_date = None
-    attached = qmlAttachedPropertiesObject(BirthdayParty, guest, False)
-    if attached:
-        rsvp_date = attached.rsvp.toString()
-    if rsvp_date:
-        print(f"    {name} RSVP date: {rsvp_date}")
-    else:
-        print(f"    {name} RSVP date: Hasn't RSVP'd")
-
-party.startParty()
-
-r = app.exec()
-
-del engine
-sys.exit(r)
+    return r
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,17 +6,18 @@ from __future__ import annotations
 import os
 import sys
 
-from PySide6.QtCore import QUrl
-from PySide6.QtGui import QGuiApplication, QSurfaceFormat
-from PySide6.QtQml import QQmlApplicationEngine
-from PySide6.QtQuick3D import QQuick3D
 
-# Imports to trigger the resources and registration of QML elements
-import resources_rc  # noqa: F401
-from examplepoint import ExamplePointGeometry  # noqa: F401
-from exampletriangle import ExampleTriangleGeometry  # noqa: F401
+def main():
+    from PySide6.QtCore import QUrl
+    from PySide6.QtGui import QGuiApplication, QSurfaceFormat
+    from PySide6.QtQml import QQmlApplicationEngine
+    from PySide6.QtQuick3D import QQuick3D
+
+    # Imports to trigger the resources and registration of QML elements
+    import resources_rc  # noqa: F401
+    from examplepoint import ExamplePointGeometry  # noqa: F401
+    from exampletriangle import ExampleTriangleGeometry  # noqa: F401
 
-if __name__ == "__main__":
     os.environ["QT_QUICK_CONTROLS_STYLE"] = "Basic"
     app = QGuiApplication(sys.argv)
 
@@ -25,6 +26,10 @@ if __name__ == "__main__":
     engine = QQmlApplicationEngine()
     engine.load(QUrl.fromLocalFile(":/main.qml"))
     if not engine.rootObjects():
-        sys.exit(-1)
+        return -1
+
+    return app.exec()
 
-    sys.exit(app.exec())
+
+if __name__ == "__main__":
+    sys.exit(main())
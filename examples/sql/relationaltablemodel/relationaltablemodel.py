@@ -8,11 +8,13 @@ import sys
 
 import connection
 
-from PySide6.QtCore import QObject, Qt
+from PySide6.QtCore import QCoreApplication, Qt
 from PySide6.QtSql import (QSqlQuery, QSqlRelation, QSqlRelationalDelegate,
                            QSqlRelationalTableModel)
 from PySide6.QtWidgets import QApplication, QTableView
 
+HEADERS = ("ID", "Name", "City", "Country")
+
 
 def initializeModel(model):
 
@@ -20,11 +22,9 @@ def initializeModel(model):
     model.setEditStrategy(QSqlRelationalTableModel.OnManualSubmit)
     model.setRelation(2, QSqlRelation("city", "id", "name"))
     model.setRelation(3, QSqlRelation("country", "id", "name"))
-    model.setHeaderData(0, Qt.Orientation.Horizontal, QObject().tr("ID"))
-
-    model.setHeaderData(1, Qt.Orientation.Horizontal, QObject().tr("Name"))
-    model.setHeaderData(2, Qt.Orientation.Horizontal, QObject().tr("City"))
-    model.setHeaderData(3, Qt.Orientation.Horizontal, QObject().tr("Country"))
+    for column, header in enumerate(HEADERS):
+        model.setHeaderData(column, Qt.Orientation.Horizontal,
+                            QCoreApplication.translate("RelationalTableModel", header))
 
     model.select()
 
@@ -39,24 +39,29 @@ def createView(title, model):
     return table_view
 
 
+def insertRows(query, statement, *columns):
+    """Insert rows given as column value lists using a single batch execution."""
+    query.prepare(statement)
+    for values in columns:
+        query.addBindValue(values)
+    query.execBatch()
+
+
 def createRelationalTables():
 
     query = QSqlQuery()
 
     query.exec("create table employee(id int primary key, name varchar(20), city int, country int)")
-    query.exec("insert into employee values(1, 'Espen', 5000, 47)")
-    query.exec("insert into employee values(2, 'Harald', 80000, 49)")
-    query.exec("insert into employee values(3, 'Sam', 100, 1)")
+    insertRows(query, "insert into employee values(?, ?, ?, ?)",
+               [1, 2, 3], ["Espen", "Harald", "Sam"], [5000, 80000, 100], [47, 49, 1])
 
     query.exec("create table city(id int, name varchar(20))")
-    query.exec("insert into city values(100, 'San Jose')")
-    query.exec("insert into city values(5000, 'Oslo')")
-    query.exec("insert into city values(80000, 'Munich')")
+    insertRows(query, "insert into city values(?, ?)",
+               [100, 5000, 80000], ["San Jose", "Oslo", "Munich"])
 
     query.exec("create table country(id int, name varchar(20))")
-    query.exec("insert into country values(1, 'USA')")
-    query.exec("insert into country values(47, 'Norway')")
-    query.exec("insert into country values(49, 'Germany')")
+    insertRows(query, "insert into country values(?, ?)",
+               [1, 47, 49], ["USA", "Norway", "Germany"])
 
 
 if __name__ == "__main__":
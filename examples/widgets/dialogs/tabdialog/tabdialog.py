@@ -22,6 +22,8 @@ from PySide6.QtWidgets import (
     QGroupBox,
 )
 
+APPLICATIONS = tuple(f"Application {i}" for i in range(1, 31))
+
 
 class TabDialog(QDialog):
     def __init__(self, file_name: str, parent: QWidget = None):
@@ -94,16 +96,13 @@ class PermissionsTab(QWidget):
         permissions_group = QGroupBox("Permissions")
 
         readable = QCheckBox("Readable")
-        if file_info.isReadable():
-            readable.setChecked(True)
+        readable.setChecked(file_info.isReadable())
 
         writable = QCheckBox("Writable")
-        if file_info.isWritable():
-            writable.setChecked(True)
+        writable.setChecked(file_info.isWritable())
 
         executable = QCheckBox("Executable")
-        if file_info.isExecutable():
-            executable.setChecked(True)
+        executable.setChecked(file_info.isExecutable())
 
         owner_group = QGroupBox("Ownership")
 
@@ -142,20 +141,17 @@ class ApplicationsTab(QWidget):
         top_label = QLabel("Open with:")
 
         applications_list_box = QListWidget()
-        applications = []
-
-        for i in range(1, 31):
-            applications.append(f"Application {i}")
-        applications_list_box.insertItems(0, applications)
+        applications_list_box.insertItems(0, APPLICATIONS)
 
-        if not file_info.suffix():
+        suffix = file_info.suffix()
+        if not suffix:
             always_check_box = QCheckBox(
                 "Always use this application to open this type of file"
             )
         else:
             always_check_box = QCheckBox(
                 f"Always use this application to open files "
-                f"with the extension {file_info.suffix()}"
+                f"with the extension {suffix}"
             )
 
         layout = QVBoxLayout()
@@ -57,16 +57,17 @@ def run(coro: Coroutine | None = None,
     # More details:
     # https://discuss.python.org/t/removing-the-asyncio-policy-system-asyncio-set-event-loop-policy-in-python-3-15/37553  # noqa: E501
     default_policy = asyncio.get_event_loop_policy()
-    asyncio.set_event_loop_policy(
-        QAsyncioEventLoopPolicy(quit_qapp=quit_qapp, handle_sigint=handle_sigint))
+    policy = QAsyncioEventLoopPolicy(quit_qapp=quit_qapp, handle_sigint=handle_sigint)
+    asyncio.set_event_loop_policy(policy)
 
     ret = None
     exc = None
 
     if keep_running:
+        loop = policy.get_event_loop()
         if coro:
-            asyncio.ensure_future(coro)
-        asyncio.get_event_loop().run_forever()
+            asyncio.ensure_future(coro, loop=loop)
+        loop.run_forever()
     else:
         if coro:
             ret = asyncio.run(coro, debug=debug)
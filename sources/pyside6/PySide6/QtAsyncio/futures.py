@@ -14,10 +14,12 @@ import enum
 class QAsyncioFuture():
     """ https://docs.python.org/3/library/asyncio-future.html """
 
-    # Declare that this class implements the Future protocol. The field must
-    # exist and be boolean - True indicates 'await' or 'yield from', False
-    # indicates 'yield'.
-    _asyncio_future_blocking = False
+    # Futures are created in large numbers, so avoid a per-instance __dict__.
+    # _log_traceback is written by asyncio (e.g. for stream futures) and
+    # __weakref__ is needed to register tasks in asyncio's weak task set.
+    __slots__ = ("_loop", "_context", "_state", "_result", "_exception",
+                 "_cancel_message", "_callbacks", "_asyncio_future_blocking",
+                 "_log_traceback", "__weakref__")
 
     class FutureState(enum.Enum):
         PENDING = enum.auto()
@@ -34,6 +36,12 @@ class QAsyncioFuture():
             self._loop = loop
         self._context = context
 
+        # Declare that this class implements the Future protocol. The field
+        # must exist and be boolean - True indicates 'await' or 'yield from',
+        # False indicates 'yield'.
+        self._asyncio_future_blocking = False
+        self._log_traceback = False
+
         self._state = QAsyncioFuture.FutureState.PENDING
         self._result: Any = None
         self._exception: BaseException | None = None
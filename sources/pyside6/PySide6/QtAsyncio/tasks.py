@@ -12,10 +12,42 @@ import collections.abc
 import concurrent.futures
 import contextvars
 
+# Bound once, as these are looked up on every task step.
+_enter_task = asyncio._enter_task
+_leave_task = asyncio._leave_task
+_isfuture = asyncio.futures.isfuture
+_register_task = asyncio._register_task
+_unregister_task = asyncio._unregister_task
+
+_PENDING = futures.QAsyncioFuture.FutureState.PENDING
+_CANCELLED = futures.QAsyncioFuture.FutureState.CANCELLED
+_DONE_WITH_RESULT = futures.QAsyncioFuture.FutureState.DONE_WITH_RESULT
+_DONE_WITH_EXCEPTION = futures.QAsyncioFuture.FutureState.DONE_WITH_EXCEPTION
+
+_EXCEPTION_MESSAGE = "An exception occurred during task execution"
+
+# Task states as shown by QAsyncioTask.__repr__(), except for
+# DONE_WITH_EXCEPTION which includes the exception.
+_STATE_LABELS = {
+    _PENDING: "Pending",
+    _DONE_WITH_RESULT: "Done",
+    _CANCELLED: "Cancelled",
+}
+
+
+class QtTaskApiMisuseError(Exception):
+    pass
+
 
 class QAsyncioTask(futures.QAsyncioFuture):
     """ https://docs.python.org/3/library/asyncio-task.html """
 
+    # _log_destroy_pending is written by asyncio, e.g. by asyncio.gather().
+    __slots__ = ("_coro", "_name", "_future_to_await", "_cancelled", "_cancel_count",
+                 "_log_destroy_pending")
+
+    QtTaskApiMisuseError = QtTaskApiMisuseError
+
     def __init__(self, coro: collections.abc.Generator | collections.abc.Coroutine, *,
                  loop: "events.QAsyncioEventLoop | None" = None, name: str | None = None,
                  context: contextvars.Context | None = None) -> None:
@@ -38,32 +70,25 @@ class QAsyncioTask(futures.QAsyncioFuture):
         self._cancelled = False  # PYSIDE-2644; see _step
         self._cancel_count = 0
         self._cancel_message: str | None = None
+        self._log_destroy_pending = True
 
         # https://docs.python.org/3/library/asyncio-extending.html#task-lifetime-support
-        asyncio._register_task(self)  # type: ignore[arg-type]
+        _register_task(self)  # type: ignore[arg-type]
 
     def __repr__(self) -> str:
-        if self._state == futures.QAsyncioFuture.FutureState.PENDING:
-            state = "Pending"
-        elif self._state == futures.QAsyncioFuture.FutureState.DONE_WITH_RESULT:
-            state = "Done"
-        elif self._state == futures.QAsyncioFuture.FutureState.DONE_WITH_EXCEPTION:
-            state = f"Done with exception ({repr(self._exception)})"
-        elif self._state == futures.QAsyncioFuture.FutureState.CANCELLED:
-            state = "Cancelled"
+        state = _STATE_LABELS.get(self._state)
+        if state is None:
+            state = f"Done with exception ({self._exception!r})"
 
         return f"Task '{self.get_name()}' with state: {state}"
 
-    class QtTaskApiMisuseError(Exception):
-        pass
-
     def set_result(self, result: Any) -> None:  # type: ignore[override]
         # This function is not inherited from the Future APIs.
-        raise QAsyncioTask.QtTaskApiMisuseError("Tasks cannot set results")
+        raise QtTaskApiMisuseError("Tasks cannot set results")
 
     def set_exception(self, exception: Any) -> None:  # type: ignore[override]
         # This function is not inherited from the Future APIs.
-        raise QAsyncioTask.QtTaskApiMisuseError("Tasks cannot set exceptions")
+        raise QtTaskApiMisuseError("Tasks cannot set exceptions")
 
     def _step(self,
               exception_or_future: BaseException | futures.QAsyncioFuture | None = None) -> None:
@@ -77,21 +102,26 @@ class QAsyncioTask(futures.QAsyncioFuture):
 
         if self.done():
             return
+        isfuture = _isfuture
+        loop = self._loop
+        context = self._context
+        coro = self._coro
         result = None
-        self._future_to_await = None
+        if self._future_to_await is not None:
+            self._future_to_await = None
 
         if self._cancelled:
             exception_or_future = asyncio.CancelledError(self._cancel_message)
             self._cancelled = False
 
-        if asyncio.futures.isfuture(exception_or_future):
+        if isfuture(exception_or_future):
             try:
                 exception_or_future.result()
             except BaseException as e:
                 exception_or_future = e
 
         try:
-            asyncio._enter_task(self._loop, self)  # type: ignore[arg-type]
+            _enter_task(loop, self)  # type: ignore[arg-type]
 
             # It is at this point that the coroutine is resumed for the current
             # step (i.e. asynchronous generator iteration). It will now be
@@ -101,25 +131,25 @@ class QAsyncioTask(futures.QAsyncioFuture):
             if isinstance(exception_or_future, BaseException):
                 # If the coroutine doesn't handle this exception, it propagates
                 # to the caller.
-                result = self._coro.throw(exception_or_future)
+                result = coro.throw(exception_or_future)
             else:
-                result = self._coro.send(None)
+                result = coro.send(None)
         except StopIteration as e:
-            self._state = futures.QAsyncioFuture.FutureState.DONE_WITH_RESULT
+            self._state = _DONE_WITH_RESULT
             self._result = e.value
         except (concurrent.futures.CancelledError, asyncio.exceptions.CancelledError) as e:
-            self._state = futures.QAsyncioFuture.FutureState.CANCELLED
+            self._state = _CANCELLED
             self._exception = e
         except BaseException as e:
-            self._state = futures.QAsyncioFuture.FutureState.DONE_WITH_EXCEPTION
+            self._state = _DONE_WITH_EXCEPTION
             self._exception = e
         else:
-            if asyncio.futures.isfuture(result):
+            if isfuture(result):
                 # If the coroutine yields a future, the task will await its
                 # completion, and at that point the step function will be
                 # called again.
                 result.add_done_callback(
-                    self._step, context=self._context)  # type: ignore[arg-type]
+                    self._step, context=context)  # type: ignore[arg-type]
 
                 # The task will await the completion (or exception) of this
                 # future. If the task is cancelled while it awaits a future,
@@ -139,34 +169,31 @@ class QAsyncioTask(futures.QAsyncioFuture):
             elif result is None:
                 # If no future was yielded, we schedule the step function again
                 # without any arguments.
-                self._loop.call_soon(self._step, context=self._context)
+                loop.call_soon(self._step, context=context)
             else:
                 # This is not supposed to happen.
                 exception = RuntimeError(f"Bad task result: {result}")
-                self._loop.call_soon(self._step, exception, context=self._context)
+                loop.call_soon(self._step, exception, context=context)
         finally:
-            asyncio._leave_task(self._loop, self)  # type: ignore[arg-type]
-
-            if self._exception:
-                message = str(self._exception)
-                if message == "None":
-                    message = ""
-                else:
-                    message = "An exception occurred during task execution"
-                self._loop.call_exception_handler({
+            _leave_task(loop, self)  # type: ignore[arg-type]
+
+            exc = self._exception
+            if exc is not None:
+                message = "" if str(exc) == "None" else _EXCEPTION_MESSAGE
+                loop.call_exception_handler({
                     "message": message,
-                    "exception": self._exception,
+                    "exception": exc,
                     "task": self,
                     "future": (exception_or_future
-                               if asyncio.futures.isfuture(exception_or_future)
+                               if isfuture(exception_or_future)
                                else None)
                 })
 
-            if self.done():
+            if self._state is not _PENDING:
                 self._schedule_callbacks()
 
                 # https://docs.python.org/3/library/asyncio-extending.html#task-lifetime-support
-                asyncio._unregister_task(self)  # type: ignore[arg-type]
+                _unregister_task(self)  # type: ignore[arg-type]
 
     def get_stack(self, *, limit=None) -> list[Any]:
         # TODO
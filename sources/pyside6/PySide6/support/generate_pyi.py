@@ -34,29 +34,31 @@ def generate_all_pyi(outpath, options):
         os.environ["PYTHONPATH"] = pypath
 
     # now we can import
-    global PySide6, inspect, typing, HintingEnumerator, build_brace_pattern
     import PySide6
-    from PySide6.support.signature.lib.enum_sig import HintingEnumerator
-    from PySide6.support.signature.lib.tool import build_brace_pattern
-    from PySide6.support.signature.lib.pyi_generator import generate_pyi
-
-    # propagate USE_PEP563 to the mapping module.
-    # Perhaps this can be automated?
-    PySide6.support.signature.mapping.USE_PEP563 = USE_PEP563
 
     outpath = Path(outpath) if outpath and os.fspath(outpath) else Path(PySide6.__file__).parent
     name_list = PySide6.__all__ if options.modules == ["all"] else options.modules
     errors = ", ".join(set(name_list) - set(PySide6.__all__))
     if errors:
         raise ImportError(f"The module(s) '{errors}' do not exist")
+
+    # The generator is only needed once the module names are validated.
+    from PySide6.support.signature.lib.pyi_generator import generate_pyi
+
+    # propagate USE_PEP563 to the mapping module.
+    # Perhaps this can be automated?
+    PySide6.support.signature.mapping.USE_PEP563 = USE_PEP563
+
+    is_pypy = hasattr(sys, "pypy_version_info")
+    if not is_pypy:
+        from PySide6.support import feature
+        feature_id = feature.get_select_id(options.feature)
     for mod_name in name_list:
         import_name = "PySide6." + mod_name
-        if hasattr(sys, "pypy_version_info"):
+        if is_pypy:
             # PYSIDE-535: We cannot use __feature__ yet in PyPy
             generate_pyi(import_name, outpath, options)
         else:
-            from PySide6.support import feature
-            feature_id = feature.get_select_id(options.feature)
             with feature.force_selection(feature_id, import_name):
                 generate_pyi(import_name, outpath, options)
 
@@ -85,9 +87,12 @@ if __name__ == "__main__":
     logger = logging.getLogger("generate_pyi")
 
     outpath = options.outpath
-    if outpath and not Path(outpath).exists():
-        os.makedirs(outpath)
-        logger.info(f"+++ Created path {outpath}")
+    if outpath:
+        try:
+            Path(outpath).mkdir(parents=True)
+            logger.info(f"+++ Created path {outpath}")
+        except FileExistsError:
+            pass
     options._pyside_call = True
     options.logger = logger
     options.is_ci = qtest_env == "ci"
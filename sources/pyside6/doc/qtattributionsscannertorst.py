@@ -6,6 +6,7 @@ from __future__ import annotations
 Tool to run qtattributionsscanner and convert its output to rst
 """
 
+import functools
 import os
 import json
 import subprocess
@@ -20,11 +21,8 @@ USAGE = "Usage: qtattributionsscannertorst [directory] [file]'"
 libexec_dir = None
 
 
-def indent(lines, indent):
-    result = ''
-    for line in lines:
-        result = f"{result}{indent}{line}\n"
-    return result
+def indent(lines, prefix):
+    return "".join(f"{prefix}{line}\n" for line in lines)
 
 
 rstHeader = """Licenses Used in Qt for Python
@@ -70,44 +68,54 @@ def rstLiteralBlockFromText(text):
     return rstLiteralBlock(text.strip().split('\n'))
 
 
-def readFile(fileName):
+def rstLiteralBlockFromFile(fileName):
+    # Indent the lines while reading instead of reading a list of lines first
     with open(fileName, 'r') as file:
-        return file.readlines()
+        return rstLiteralBlock(file)
+
+
+@functools.cache
+def rstLicenseFile(fileName):
+    """Return the literal block of a license file or None if it does not exist.
+       Several entries typically share the same license file."""
+    return rstLiteralBlockFromFile(fileName) if Path(fileName).is_file() else None
 
 
 def get_libexec_dir():
-    libexec_b = subprocess.check_output("qtpaths6 -query QT_INSTALL_LIBEXECS", shell=True)
-    return libexec_b.decode('utf-8').strip()
+    result = subprocess.run(["qtpaths6", "-query", "QT_INSTALL_LIBEXECS"],
+                            capture_output=True, check=True, text=True)
+    return result.stdout.strip()
 
 
 def runScanner(directory, targetFileName, libexec_dir):
     # qtattributionsscanner recursively searches for qt_attribution.json files
     # and outputs them in JSON with the paths of the 'LicenseFile' made absolute
     scanner = os.path.join(libexec_dir, 'qtattributionsscanner')
-    command = f'{scanner}  --output-format json {directory}'
-    jsonS = subprocess.check_output(command, shell=True)
+    command = [scanner, '--output-format', 'json', os.fspath(directory)]
+    jsonS = subprocess.run(command, capture_output=True, check=True).stdout
     if not jsonS:
-        raise RuntimeError(f'{command} failed to produce output.')
+        raise RuntimeError(f'{" ".join(command)} failed to produce output.')
 
     with open(targetFileName, 'w') as targetFile:
         targetFile.write(rstHeader)
-        for entry in json.loads(jsonS.decode('utf-8')):
-            content = f"{entry['Name']}\n{entry['Description']}\n{entry['QtUsage']}\n\n"
+        for entry in json.loads(jsonS):
+            content = [f"{entry['Name']}\n{entry['Description']}\n{entry['QtUsage']}\n\n"]
             url = entry['Homepage']
             version = entry['Version']
             if url and version:
-                content = f"{content}{rstUrl('Project Homepage', url)}, upstream version: {version}\n\n"  # noqa E:501
+                content.append(f"{rstUrl('Project Homepage', url)}, upstream version: {version}\n\n")  # noqa E:501
             copyright = entry['Copyright']
             if copyright:
-                content += rstLiteralBlockFromText(copyright)
-            content += entry['License'] + '\n\n'
+                content.append(rstLiteralBlockFromText(copyright))
+            content.append(entry['License'] + '\n\n')
             licenseFile = entry['LicenseFile']
             if licenseFile:
-                if Path(licenseFile).is_file():
-                    content += rstLiteralBlock(readFile(licenseFile))
+                licenseBlock = rstLicenseFile(licenseFile)
+                if licenseBlock is not None:
+                    content.append(licenseBlock)
                 else:
                     warnings.warn(f'"{licenseFile}" is not a file', RuntimeWarning)
-            targetFile.write(content)
+            targetFile.write("".join(content))
 
 
 if __name__ == '__main__':
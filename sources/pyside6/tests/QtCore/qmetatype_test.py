@@ -19,25 +19,15 @@ from PySide6.QtCore import (QMetaType, QObject, QPoint)
 
 class qmetatype_test(unittest.TestCase):
     def test_ObjectSlotSignal(self):
-        meta_type = QMetaType(int)
-        self.assertTrue(meta_type.isValid())
-        self.assertEqual(meta_type.name(), "int")
-
-        meta_type = QMetaType(str)
-        self.assertTrue(meta_type.isValid())
-        self.assertEqual(meta_type.name(), "QString")
-
-        meta_type = QMetaType(float)
-        self.assertTrue(meta_type.isValid())
-        self.assertEqual(meta_type.name(), "double")
-
-        meta_type = QMetaType(QPoint)
-        self.assertTrue(meta_type.isValid())
-        self.assertEqual(meta_type.name(), "QPoint")
-
-        meta_type = QMetaType(QObject)
-        self.assertTrue(meta_type.isValid())
-        self.assertEqual(meta_type.name(), "QObject*")
+        expected_names = ((int, "int"), (str, "QString"), (float, "double"),
+                          (QPoint, "QPoint"), (QObject, "QObject*"))
+        for py_type, name in expected_names:
+            with self.subTest(type=py_type.__name__):
+                meta_type = QMetaType(py_type)
+                self.assertTrue(meta_type.isValid())
+                self.assertEqual(meta_type.name(), name)
+                # The same Python type always maps to the same registered type
+                self.assertEqual(QMetaType(py_type).id(), meta_type.id())
 
 
 if __name__ == '__main__':
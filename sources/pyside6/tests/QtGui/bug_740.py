@@ -11,15 +11,22 @@ sys.path.append(os.fspath(Path(__file__).resolve().parents[1]))
 from init_paths import init_test_paths
 init_test_paths(False)
 
-from helper.usesqapplication import UsesQApplication
+from helper.sharedqguiapplication import shared_qguiapplication
 from PySide6.QtCore import QSize
 from PySide6.QtGui import QBitmap, QImage
 
 
-class TestQBitmap(UsesQApplication):
+class TestQBitmap(unittest.TestCase):
+    # One byte per row of an 8x48 monochrome bitmap
+    dataBits = (b'\x38\x28\x38' + 37 * b'\x10'
+                + b'\xfe\xfe\x7c\x7c\x38\x38\x10\x10')
+
+    @classmethod
+    def setUpClass(cls):
+        shared_qguiapplication()
+
     def testFromDataMethod(self):
-        dataBits = bytes('\x38\x28\x38\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\x10\xfe\xfe\x7c\x7c\x38\x38\x10\x10', "UTF-8")
-        bim = QBitmap.fromData(QSize(8, 48), dataBits, QImage.Format_Mono)  # missing function
+        bim = QBitmap.fromData(QSize(8, 48), self.dataBits, QImage.Format_Mono)  # missing function
 
 
 if __name__ == '__main__':
@@ -12,24 +12,27 @@ sys.path.append(os.fspath(Path(__file__).resolve().parents[1]))
 from init_paths import init_test_paths
 init_test_paths(False)
 
-from PySide6.QtCore import QFile
-from PySide6.QtGui import QGuiApplication
+from PySide6.QtCore import QCoreApplication, QFile
 from PySide6.QtSvg import QSvgRenderer
 
 
 class QSvgRendererTest(unittest.TestCase):
 
-    def testLoad(self):
-        tigerPath = os.path.join(os.path.dirname(__file__), 'tiger.svg')
-        app = QGuiApplication([])
+    @classmethod
+    def setUpClass(cls):
+        # Parsing does not need a QGuiApplication (platform plugin, fonts).
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+        cls.tigerPath = os.path.join(os.path.dirname(__file__), 'tiger.svg')
+        tigerFile = QFile(cls.tigerPath)
+        tigerFile.open(QFile.ReadOnly)
+        cls.tigerData = tigerFile.readAll()
+        tigerFile.close()
 
-        fromFile = QSvgRenderer(tigerPath)
+    def testLoad(self):
+        fromFile = QSvgRenderer(self.tigerPath)
         self.assertTrue(fromFile.isValid())
 
-        tigerFile = QFile(tigerPath)
-        tigerFile.open(QFile.ReadOnly)
-        tigerData = tigerFile.readAll()
-        fromContents = QSvgRenderer(tigerData)
+        fromContents = QSvgRenderer(self.tigerData)
         self.assertTrue(fromContents.isValid())
 
 
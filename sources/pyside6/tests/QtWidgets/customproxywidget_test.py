@@ -12,8 +12,9 @@ from init_paths import init_test_paths
 init_test_paths(False)
 
 from helper.usesqapplication import UsesQApplication
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QPainter
+from PySide6.QtTest import QTest
 from PySide6.QtWidgets import QLabel
 from PySide6.QtWidgets import QGraphicsScene, QGraphicsView, QGraphicsItem, QGraphicsProxyWidget
 
@@ -39,8 +40,10 @@ class CustomProxyWidgetTest(UsesQApplication):
         view.setViewportUpdateMode(QGraphicsView.BoundingRectViewportUpdate)
         view.show()
 
-        timer = QTimer.singleShot(100, self.app.quit)
-        self.app.exec()
+        # Wait for the expose event, then flush the resulting paint events.
+        self.assertTrue(QTest.qWaitForWindowExposed(view))
+        self.app.processEvents()
+        view.close()
 
 
 if __name__ == '__main__':
@@ -6,11 +6,16 @@ import os
 import sys
 
 SRC_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(SRC_DIR)),
-                             'shiboken6', 'tests'))
+_SHIBOKEN_TESTS_DIR = os.path.join(os.path.dirname(os.path.dirname(SRC_DIR)),
+                                   'shiboken6', 'tests')
+if _SHIBOKEN_TESTS_DIR not in sys.path:
+    sys.path.append(_SHIBOKEN_TESTS_DIR)
 from shiboken_paths import (get_dir_env_var, get_build_dir, add_python_dirs,
                             add_lib_dirs, shiboken_paths)
 
+# Path configurations already applied, see _init_test_paths().
+_initialized = set()
+
 
 def _get_qt_dir():
     """Retrieve the location of Qt."""
@@ -44,10 +49,15 @@ def _init_test_paths(shiboken_tests=False, testbindings_module=False):
     """Sets the correct import paths (Python modules and C++ library paths)
        for PySide tests and shiboken6 tests using depending on the environment
        variables BUILD_DIR and QT_DIR pointing to the build directory and
-       Qt directory, respectively."""
-    src_dir = os.path.dirname(os.path.abspath(__file__))
+       Qt directory, respectively.
+       Repeated calls with the same arguments do nothing, so that the
+       library path variables do not grow when several test modules are
+       run in one process."""
+    key = (shiboken_tests, testbindings_module)
+    if key in _initialized:
+        return
 
-    python_dirs = [os.path.join(src_dir, 'util')]  # Helper module
+    python_dirs = [os.path.join(SRC_DIR, 'util')]  # Helper module
 
     pyside_build_dir = os.path.join(get_build_dir(), 'pyside6')
     python_dirs.append(pyside_build_dir)   # for PySide6
@@ -65,6 +75,7 @@ def _init_test_paths(shiboken_tests=False, testbindings_module=False):
 
     add_python_dirs(python_dirs)
     add_lib_dirs(lib_dirs)
+    _initialized.add(key)
 
 
 def init_test_paths(testbindings_module=False):
@@ -20,83 +20,40 @@ class ModelViewTest(unittest.TestCase):
     def callback(self, o):
         self._called = o
 
+    def _checkSignal(self, cls, signalName, callSignalName, value=None):
+        """Connect the signal of one object once and trigger it by emit()
+           and by the C++ method emitting it."""
+        o = cls(None)
+        arg = o if value is None else value
+        signal = getattr(o, signalName)
+        signal.connect(self.callback)
+        for name, trigger in (("emit", signal.emit), (callSignalName, getattr(o, callSignalName))):
+            with self.subTest(trigger=name):
+                self._called = None
+                trigger(arg)
+                self.assertEqual(arg, self._called)
+
     def testWithoutNamespace(self):
-        self._called = None
-        o = PySideCPP.TestObjectWithNamespace(None)
-        o.emitSignal.connect(self.callback)
-        o.emitSignal.emit(o)
-        self.assertTrue(o == self._called)
-
-        self._called = None
-        o = PySideCPP.TestObjectWithNamespace(None)
-        o.emitSignal.connect(self.callback)
-        o.callSignal(o)
-        self.assertTrue(o == self._called)
+        self._checkSignal(PySideCPP.TestObjectWithNamespace, "emitSignal", "callSignal")
 
     def testWithNamespace(self):
-        self._called = None
-        o = PySideCPP.TestObjectWithNamespace(None)
-        o.emitSignalWithNamespace.connect(self.callback)
-        o.emitSignalWithNamespace.emit(o)
-        self.assertTrue(o == self._called)
-
-        self._called = None
-        o = PySideCPP.TestObjectWithNamespace(None)
-        o.emitSignalWithNamespace.connect(self.callback)
-        o.callSignalWithNamespace(o)
-        self.assertTrue(o == self._called)
+        self._checkSignal(PySideCPP.TestObjectWithNamespace, "emitSignalWithNamespace",
+                          "callSignalWithNamespace")
 
     def testWithoutNamespace1(self):
-        self._called = None
-        o = TestObjectWithoutNamespace(None)
-        o.emitSignal.connect(self.callback)
-        o.emitSignal.emit(o)
-        self.assertTrue(o == self._called)
-
-        self._called = None
-        o = TestObjectWithoutNamespace(None)
-        o.emitSignal.connect(self.callback)
-        o.callSignal(o)
-        self.assertTrue(o == self._called)
+        self._checkSignal(TestObjectWithoutNamespace, "emitSignal", "callSignal")
 
     def testWithNamespace1(self):
-        self._called = None
-        o = TestObjectWithoutNamespace(None)
-        o.emitSignalWithNamespace.connect(self.callback)
-        o.emitSignalWithNamespace.emit(o)
-        self.assertTrue(o == self._called)
-
-        self._called = None
-        o = TestObjectWithoutNamespace(None)
-        o.emitSignalWithNamespace.connect(self.callback)
-        o.callSignalWithNamespace(o)
-        self.assertTrue(o == self._called)
+        self._checkSignal(TestObjectWithoutNamespace, "emitSignalWithNamespace",
+                          "callSignalWithNamespace")
 
     def testTypedfWithouNamespace(self):
-        self._called = None
-        o = PySideCPP.TestObjectWithNamespace(None)
-        o.emitSignalWithTypedef.connect(self.callback)
-        o.emitSignalWithTypedef.emit(10)
-        self.assertEqual(10, self._called)
-
-        self._called = None
-        o = PySideCPP.TestObjectWithNamespace(None)
-        o.emitSignalWithTypedef.connect(self.callback)
-        o.callSignalWithTypedef(10)
-        self.assertEqual(10, self._called)
+        self._checkSignal(PySideCPP.TestObjectWithNamespace, "emitSignalWithTypedef",
+                          "callSignalWithTypedef", 10)
 
     def testTypedefWithNamespace(self):
-        self._called = None
-        o = TestObjectWithoutNamespace(None)
-        o.emitSignalWithTypedef.connect(self.callback)
-        o.emitSignalWithTypedef.emit(10)
-        self.assertEqual(10, self._called)
-
-        self._called = None
-        o = TestObjectWithoutNamespace(None)
-        o.emitSignalWithTypedef.connect(self.callback)
-        o.callSignalWithTypedef(10)
-        self.assertEqual(10, self._called)
+        self._checkSignal(TestObjectWithoutNamespace, "emitSignalWithTypedef",
+                          "callSignalWithTypedef", 10)
 
 
 if __name__ == '__main__':
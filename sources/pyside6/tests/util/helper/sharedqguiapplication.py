@@ -0,0 +1,19 @@
+# Copyright (C) 2026 The Qt Company Ltd.
+# SPDX-License-Identifier: LicenseRef-Qt-Commercial OR GPL-3.0-only WITH Qt-GPL-exception-1.0
+from __future__ import annotations
+
+'''Helper providing one QGuiApplication for all tests of a process'''
+
+from PySide6.QtGui import QGuiApplication
+
+_app = None
+
+
+def shared_qguiapplication():
+    '''Returns the QGuiApplication instance, creating it on first use.
+    The instance is kept alive until the interpreter exits so that the
+    platform plugin and font database are initialized only once.'''
+    global _app
+    if _app is None:
+        _app = QGuiApplication.instance() or QGuiApplication([])
+    return _app
@@ -8,7 +8,8 @@ import gc
 import unittest
 
 from PySide6.QtCore import QTimer
-from PySide6.QtGui import QGuiApplication
+
+from helper.sharedqguiapplication import shared_qguiapplication
 
 
 class TimedQGuiApplication(unittest.TestCase):
@@ -18,7 +19,7 @@ class TimedQGuiApplication(unittest.TestCase):
         '''Sets up this Application.
 
         timeout - timeout in millisseconds'''
-        self.app = QGuiApplication.instance() or QGuiApplication([])
+        self.app = shared_qguiapplication()
         QTimer.singleShot(timeout, self.app.quit)
 
     def tearDown(self):
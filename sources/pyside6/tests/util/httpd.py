@@ -11,7 +11,11 @@ import socketserver as SocketServer
 import tempfile
 import threading
 
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "util"))
+from pathlib import Path
+
+_UTIL_PATH = os.fspath(Path(__file__).resolve().parents[1] / "util")
+if _UTIL_PATH not in sys.path:
+    sys.path.append(_UTIL_PATH)
 
 
 class TestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
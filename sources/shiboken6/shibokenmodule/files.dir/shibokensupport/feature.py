@@ -20,11 +20,14 @@ Alternatively, there is the `set_selection` function which uses select_id's
 and takes an optional `mod_name` parameter.
 
 The select id `-1` has the special meaning "ignore this module".
+Ignored modules are not stored in `pyside_feature_dict` but in the set
+`_ignored_modules`; a missing entry is treated like `-1` when switching.
 """
 
 import inspect
 import sys
 from contextlib import contextmanager
+from functools import lru_cache
 
 all_feature_names = [
     "snake_case",
@@ -51,6 +54,7 @@ _feature_80 = 0x80
 # let's remove the dummies for the normal user
 _really_all_feature_names = all_feature_names[:]
 all_feature_names = list(_ for _ in all_feature_names if not _.startswith("_"))
+_FEATURE_BITS = {name: globals()[name] for name in _really_all_feature_names}
 
 # Install an import hook that controls the `__feature__` import.
 """
@@ -91,32 +95,37 @@ def feature_import(name, *args, **kwargs):
     # PYSIDE-1338: The "1" below is the redirection in loader.py .
     # PYSIDE-1548: Ensure that features are not affected by other imports.
     # PYSIDE-2029: Need to always switch. The cache was wrong interpreted.
+    if name != "__feature__" or not args[2]:
+        # Redirect to the original import
+        return None
+
+    # The calling frame is only needed when a feature is actually requested.
     calling_frame = _cf = sys._getframe(1).f_back
     importing_module = _cf.f_globals.get("__name__", "__main__") if _cf else "__main__"
     existing = pyside_feature_dict.get(importing_module, 0)
 
-    if name == "__feature__" and args[2]:
-        __init__()
+    __init__()
+    _ignored_modules.discard(importing_module)
 
-        # This is an `import from` statement that corresponds to `IMPORT_NAME`.
-        # The following `IMPORT_FROM` will handle errors. (Confusing, ofc.)
-        flag = get_select_id(args[2])
+    # This is an `import from` statement that corresponds to `IMPORT_NAME`.
+    # The following `IMPORT_FROM` will handle errors. (Confusing, ofc.)
+    flag = get_select_id(args[2])
 
-        flag |= existing & 255 if isinstance(existing, int) and existing >= 0 else 0
-        pyside_feature_dict[importing_module] = flag
+    flag |= existing & 255 if isinstance(existing, int) and existing >= 0 else 0
+    pyside_feature_dict[importing_module] = flag
 
-        if importing_module == "__main__":
-            # We need to add all modules here which should see __feature__.
-            pyside_feature_dict["rlcompleter"] = flag
+    if importing_module == "__main__":
+        # We need to add all modules here which should see __feature__.
+        _ignored_modules.discard("rlcompleter")
+        pyside_feature_dict["rlcompleter"] = flag
 
-        # Initialize feature (multiple times allowed) and clear cache.
-        sys.modules["PySide6.QtCore"].__init_feature__()
-        return sys.modules["__feature__"]
-    # Redirect to the original import
-    return None
+    # Initialize feature (multiple times allowed) and clear cache.
+    sys.modules["PySide6.QtCore"].__init_feature__()
+    return sys.modules["__feature__"]
 
 
 _is_initialized = False
+_ignored_modules = set()
 
 
 def __init__():
@@ -125,9 +134,10 @@ def __init__():
         # use _one_ recursive import...
         import PySide6.QtCore
         # Initialize all prior imported modules
-        for name, module in sys.modules.items():
-            if name not in pyside_feature_dict:
-                pyside_feature_dict[name] = 0 if _mod_uses_pyside(module) else -1
+        modules = sys.modules
+        missing = modules.keys() - pyside_feature_dict.keys() - _ignored_modules
+        for name in missing:
+            _register_module(name, modules[name])
         _is_initialized = True
 
 
@@ -143,8 +153,15 @@ def feature_imported(module):
     # PYSIDE-1368: The `__name__` attribute does not need to exist in all modules.
     if hasattr(module, "__name__"):
         name = module.__name__
-        if name not in pyside_feature_dict:
-            pyside_feature_dict[name] = 0 if _mod_uses_pyside(module) else -1
+        if name not in pyside_feature_dict and name not in _ignored_modules:
+            _register_module(name, module)
+
+
+def _register_module(name, module):
+    if _mod_uses_pyside(module):
+        pyside_feature_dict[name] = 0
+    else:
+        _ignored_modules.add(name)
 
 
 def _mod_uses_pyside(module):
@@ -154,6 +171,9 @@ def _mod_uses_pyside(module):
     Simple approach: Search the source code for the string "PySide6".
     Maybe we later support source-less modules by inspecting all code objects.
     """
+    if getattr(module, "__name__", None) in sys.builtin_module_names:
+        # builtin modules like sys have no source to inspect
+        return False
     try:
         source = inspect.getsource(module)
     except TypeError:
@@ -185,6 +205,7 @@ def set_selection(select_id, mod_name=None):
     flag = 0
     if isinstance(select_id, int):
         flag = select_id & 255
+    _ignored_modules.discard(mod_name)
     pyside_feature_dict[mod_name] = flag
     sys.modules["PySide6.QtCore"].__init_feature__()
     return _current_selection(flag)
@@ -195,6 +216,7 @@ def set_selection(select_id, mod_name=None):
 def reset():
     set_selection(0)
     pyside_feature_dict.clear()
+    _ignored_modules.clear()
     _is_initialized = False
 
 
@@ -208,21 +230,29 @@ def info(mod_name=None):
 
 
 def _current_selection(flag):
-    names = []
-    if flag >= 0:
-        for idx, name in enumerate(_really_all_feature_names):
-            if (1 << idx) & flag:
-                names.append(name)
-    return names
+    return list(_selected_names(flag))
+
+
+@lru_cache(maxsize=256)
+def _selected_names(flag):
+    if flag < 0:
+        return ()
+    return tuple(name for name, bit in _FEATURE_BITS.items() if bit & flag)
 
 
 def get_select_id(feature_names):
+    # The importer passes the `fromlist` tuple; other callers may pass a list.
+    return _get_select_id(tuple(feature_names))
+
+
+@lru_cache(maxsize=64)
+def _get_select_id(feature_names):
     flag = 0
     for feature in feature_names:
-        if feature in _really_all_feature_names:
-            flag |= globals()[feature]
-        else:
+        bit = _FEATURE_BITS.get(feature)
+        if bit is None:
             raise SyntaxError(f"PySide feature {feature} is not defined")
+        flag |= bit
     return flag
 
 
@@ -236,14 +266,18 @@ def force_selection(select_id, mod_name):
     """
     __init__()
     saved_feature_dict = pyside_feature_dict.copy()
-    for name in pyside_feature_dict:
+    saved_ignored_modules = _ignored_modules.copy()
+    for name in saved_feature_dict.keys() | saved_ignored_modules:
         set_selection(0, name)
     __import__(mod_name)
-    for name in pyside_feature_dict.copy():
+    for name in pyside_feature_dict.keys() | _ignored_modules:
         set_selection(select_id, name)
     try:
         yield
     finally:
+        for name in saved_ignored_modules:
+            pyside_feature_dict.pop(name, None)
+        _ignored_modules.update(saved_ignored_modules)
         pyside_feature_dict.update(saved_feature_dict)
 
 #eof
@@ -22,6 +22,8 @@ import inspect
 import typing
 
 from types import SimpleNamespace
+from typing import Any as _Any, Union as _Union
+from typing import get_args as _get_args, get_origin as _get_origin
 from textwrap import dedent
 from shibokensupport.signature.mapping import ellipsis
 
@@ -47,15 +49,15 @@ class SignatureLayout(SimpleNamespace):
     allowed_values = True, False
 
     def __init__(self, **kwds):
-        args = SimpleNamespace(**self.allowed_keys.__dict__)
-        args.__dict__.update(kwds)
-        self.__dict__.update(args.__dict__)
-        err_keys = list(set(self.__dict__) - set(self.allowed_keys.__dict__))
+        allowed_keys = self.allowed_keys.__dict__
+        err_keys = list(key for key in kwds if key not in allowed_keys)
         if err_keys:
             self._attributeerror(err_keys)
-        err_values = list(set(self.__dict__.values()) - set(self.allowed_values))
+        err_values = list(value for value in kwds.values() if value not in self.allowed_values)
         if err_values:
             self._valueerror(err_values)
+        self.__dict__.update(allowed_keys)
+        self.__dict__.update(kwds)
 
     def __setattr__(self, key, value):
         if key not in self.allowed_keys.__dict__:
@@ -96,6 +98,13 @@ typeerror = SignatureLayout(definition=False,
                             return_annotation=False,
                             parameter_names=False)
 
+_LAYOUTS = {
+    "signature": signature,
+    "existence": existence,
+    "hintingstub": hintingstub,
+    "typeerror": typeerror,
+}
+
 
 def define_nameless_parameter():
     """
@@ -158,17 +167,6 @@ hack that also won't work in Python 2 and would be _very_ complex.
 #     Optional = typing.Optional
 
 
-def make_signature_nameless(signature):
-    """
-    Make a Signature Nameless
-
-    We use an existing signature and change the type of its parameters.
-    The signature looks different, but is totally intact.
-    """
-    for key in signature.parameters.keys():
-        signature.parameters[key].__class__ = NamelessParameter
-
-
 _POSITIONAL_ONLY         = inspect.Parameter.POSITIONAL_ONLY  # noqa E:201
 _POSITIONAL_OR_KEYWORD   = inspect.Parameter.POSITIONAL_OR_KEYWORD  # noqa E:201
 _VAR_POSITIONAL          = inspect.Parameter.VAR_POSITIONAL  # noqa E:201
@@ -185,6 +183,27 @@ default_weights = {
 }
 
 
+_mro_lengths = {}
+
+
+def _compute_mro_length(anno):
+    # Types keep their mro as a tuple. Typing aliases like `typing.List[int]`
+    # have no `__mro__` but forward `mro()` to their origin.
+    mro = getattr(anno, "__mro__", None)
+    return len(mro) if mro is not None else len(anno.mro())
+
+
+def _mro_length(anno):
+    try:
+        return _mro_lengths[anno]
+    except KeyError:
+        leng = _mro_lengths[anno] = _compute_mro_length(anno)
+        return leng
+    except TypeError:
+        # An unhashable annotation.
+        return _compute_mro_length(anno)
+
+
 def get_ordering_key(anno):
     """
     This is the main sorting algorithm for annotations.
@@ -202,11 +221,11 @@ def get_ordering_key(anno):
     A special case are numeric types, which have also an ordering between them.
     They can be handled separately, since they are all of the shortest mro.
     """
-    typing_type = typing.get_origin(anno)
-    is_union = typing_type is typing.Union
+    typing_type = _get_origin(anno)
+    is_union = typing_type is _Union
     if is_union:
         # This is some Union-like construct.
-        typing_args = typing.get_args(anno)
+        typing_args = _get_args(anno)
         parts = len(typing_args)
 
         if defaults := list(ann for ann in typing_args if ann in default_weights):
@@ -221,12 +240,12 @@ def get_ordering_key(anno):
             # Normal: Use the union arg with the shortest mro().
             leng = 9999
             for ann in typing_args:
-                lng = len(ann.mro())
+                lng = _mro_length(ann)
                 if lng < leng:
                     leng = lng
                     anno = ann
     else:
-        leng = len(anno.mro()) if anno not in (type, None, typing.Any) else 0
+        leng = _mro_length(anno) if anno not in (type, None, _Any) else 0
         parts = 1
     if anno in default_weights:
         leng = - default_weights[anno]
@@ -238,49 +257,58 @@ def get_ordering_key(anno):
     return (-leng, parts, name)
 
 
-def sort_by_inheritance(signatures):
-    # First decorate all signatures with a key built by the mro.
-    for idx, sig in enumerate(signatures):
-        sort_order = []
-        for param in list(sig.parameters.values()):
-            sort_order.append(get_ordering_key(param.annotation))
-        signatures[idx] = sort_order, sig
+# The same annotations occur over and over again in a module.
+# Union[A, B] == Union[B, A], but get_ordering_key breaks ties by argument
+# order, so the arguments are part of the cache key.
+_ordering_keys = {}
+
+
+def _cached_ordering_key(anno):
+    try:
+        cache_key = anno, _get_args(anno)
+        return _ordering_keys[cache_key]
+    except KeyError:
+        key = _ordering_keys[cache_key] = get_ordering_key(anno)
+        return key
+    except TypeError:
+        # An unhashable annotation.
+        return get_ordering_key(anno)
 
-    # Sort the signatures and remove the key column again.
-    signatures = sorted(signatures, key=lambda x: x[0])
-    for idx, sig in enumerate(signatures):
-        signatures[idx] = sig[1]
-    return signatures
+
+def _signature_ordering_key(sig):
+    return tuple(map(_cached_ordering_key,
+                     (param.annotation for param in sig.parameters.values())))
+
+
+def sort_by_inheritance(signatures):
+    # Sort the signatures by a key built by the mro of the annotations.
+    return sorted(signatures, key=_signature_ordering_key)
 
 
 def _remove_ambiguous_signatures_body(signatures):
     # By the sorting of signatures, duplicates will always be adjacent.
     last_ann = last_sig = None
     last_idx = -1
-    to_delete = []
+    to_delete = set()
     found = False
-    for idx, sig in enumerate(signatures):
-        annos = []
-        for param in list(sig.parameters.values()):
-            annos.append(param.annotation)
+    all_annos = list(tuple(param.annotation for param in sig.parameters.values())
+                     for sig in signatures)
+    for idx, (sig, annos) in enumerate(zip(signatures, all_annos)):
         if annos == last_ann:
             found = True
             if sig.return_annotation is last_sig.return_annotation:
                 # we can use any duplicate
-                to_delete.append(idx)
+                to_delete.add(idx)
             else:
                 # delete the one which has non-empty result
-                to_delete.append(idx if not sig.return_annotation else last_idx)
+                to_delete.add(idx if not sig.return_annotation else last_idx)
         last_ann = annos
         last_sig = sig
         last_idx = idx
 
     if not found:
         return False, signatures
-    new_sigs = []
-    for idx, sig in enumerate(signatures):
-        if idx not in to_delete:
-            new_sigs.append(sig)
+    new_sigs = list(sig for idx, sig in enumerate(signatures) if idx not in to_delete)
     return True, new_sigs
 
 
@@ -299,9 +327,10 @@ def create_signature(props, key):
     if isinstance(props["multi"], list):
         # multi sig: call recursively.
         res = list(create_signature(elem, key) for elem in props["multi"])
-        # PYSIDE-2846: Sort multi-signatures by inheritance in order to avoid shadowing.
-        res = sort_by_inheritance(res)
-        res = remove_ambiguous_signatures(res)
+        if len(res) > 1:
+            # PYSIDE-2846: Sort multi-signatures by inheritance in order to avoid shadowing.
+            res = sort_by_inheritance(res)
+            res = remove_ambiguous_signatures(res)
         return res if len(res) > 1 else res[0]
 
     if type(key) is tuple:
@@ -309,8 +338,8 @@ def create_signature(props, key):
     else:
         _, modifier = key, "signature"
 
-    layout = globals()[modifier]  # lookup of the modifier in this module
-    if not isinstance(layout, SignatureLayout):
+    layout = _LAYOUTS.get(modifier)
+    if layout is None:
         raise SystemError("Modifiers must be names of a SignatureLayout "
                           "instance")
 
@@ -325,43 +354,38 @@ def create_signature(props, key):
         if varnames and varnames[0] in ("self", "cls"):
             varnames = varnames[1:]
 
-    # calculate the modifications
-    defaults = props["defaults"][:]
-    if not layout.defaults:
-        defaults = ()
-    annotations = props["annotations"].copy()
-    if not layout.return_annotation and "return" in annotations:
-        del annotations["return"]
+    # calculate the modifications (the props are only read, not copied)
+    defaults = props["defaults"] if layout.defaults else ()
+    annotations = props["annotations"]
+    return_annotation = annotations.get("return", _empty) if layout.return_annotation else _empty
 
     # Build a signature.
-    kind = inspect._POSITIONAL_OR_KEYWORD
+    # The special case of nameless parameters is built right away.
+    Parameter = inspect.Parameter if layout.parameter_names else NamelessParameter
+    Optional = typing.Optional
+    use_ellipsis = layout.ellipsis
+    defpos_offset = len(defaults) - len(varnames)
+    kind = _POSITIONAL_OR_KEYWORD
     params = []
     for idx, name in enumerate(varnames):
-        if name.startswith("**"):
-            kind = _VAR_KEYWORD
-        elif name.startswith("*"):
-            kind = _VAR_POSITIONAL
         ann = annotations.get(name, _empty)
         if ann in ("self", "cls"):
             ann = _empty
-        name = name.lstrip("*")
-        defpos = idx - len(varnames) + len(defaults)
+        if name[:1] == "*":
+            kind = _VAR_KEYWORD if name[:2] == "**" else _VAR_POSITIONAL
+            name = name.lstrip("*")
+        defpos = idx + defpos_offset
         default = defaults[defpos] if defpos >= 0 else _empty
         if default is None:
-            ann = typing.Optional[ann]
-        if default is not _empty and layout.ellipsis:
+            ann = Optional[ann]
+        if default is not _empty and use_ellipsis:
             default = ellipsis
-        param = inspect.Parameter(name, kind, annotation=ann, default=default)
-        params.append(param)
+        params.append(Parameter(name, kind, annotation=ann, default=default))
         if kind == _VAR_POSITIONAL:
             kind = _KEYWORD_ONLY
     sig = inspect.Signature(params,
-                            return_annotation=annotations.get('return', _empty),
+                            return_annotation=return_annotation,
                             __validate_parameters__=False)
-
-    # the special case of nameless parameters
-    if not layout.parameter_names:
-        make_signature_nameless(sig)
     return sig
 
 # end of file
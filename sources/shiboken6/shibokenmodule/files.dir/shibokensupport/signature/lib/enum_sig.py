@@ -39,8 +39,9 @@ if hasattr(sys, "pypy_version_info"):
     _normal_functions += (type(get_sig),)
 
 
-def signal_check(thing):
-    return thing and type(thing) in (Signal, SignalInstance)
+# PYSIDE-2846: Signatures of special functions which inherit from object.
+_DIR_SIGNATURE = inspect.Signature([], return_annotation=typing.Iterable[str])
+_REPR_SIGNATURE = inspect.Signature([], return_annotation=str)
 
 
 class ExactEnumerator(object):
@@ -67,13 +68,15 @@ class ExactEnumerator(object):
     mypy_misc_class_errors.add("QPyDesignerPropertySheetExtension")
 
     def __init__(self, formatter, result_type=dict):
-        global EnumMeta, Signal, SignalInstance
+        global EnumMeta
         try:
             # Lazy import
             from PySide6.QtCore import Qt, Signal, SignalInstance
             EnumMeta = type(Qt.Key)
+            self.signal_types = (Signal, SignalInstance)
         except ImportError:
-            EnumMeta = Signal = SignalInstance = None
+            EnumMeta = None
+            self.signal_types = ()
 
         self.fmt = formatter
         self.result_type = result_type
@@ -107,11 +110,11 @@ class ExactEnumerator(object):
             for class_name, klass in members:
                 self.collision_track = set()
                 ret.update(self.klass(class_name, klass))
-            if len(members):
+            if members:
                 self.section()
             for func_name, func in functions:
                 ret.update(self.function(func_name, func))
-            if len(functions):
+            if functions:
                 self.section()
             return ret
 
@@ -126,17 +129,12 @@ class ExactEnumerator(object):
             # class std::shared_ptr<QQuickItemGrabResult >:
             # We simply skip over this class.
             return ret
-        bases_list = []
-        for base in klass.__bases__:
-            name = base.__qualname__
-            if name not in ("object", "property", "type"):
-                name = base.__module__ + "." + name
-            bases_list.append(name)
-        bases_str = ', '.join(bases_list)
+        bases_str = ", ".join(name if (name := base.__qualname__) in ("object", "property", "type")
+                              else f"{base.__module__}.{name}" for base in klass.__bases__)
         class_str = f"{class_name}({bases_str})"
         # class_members = inspect.getmembers(klass)
         # gives us also the inherited things.
-        class_members = sorted(list(klass.__dict__.items()))
+        class_members = sorted(klass.__dict__.items())
         subclasses = []
         functions = []
         enums = []
@@ -144,8 +142,10 @@ class ExactEnumerator(object):
         signals = []
         attributes = {}
 
+        signal_types = self.signal_types
         for thing_name, thing in class_members:
-            if signal_check(thing):
+            thing_type = type(thing)
+            if thing_type in signal_types:
                 signals.append((thing_name, thing))
             elif inspect.isclass(thing):
                 # If this is the only member of the class, it causes the stub
@@ -159,16 +159,17 @@ class ExactEnumerator(object):
             elif inspect.isroutine(thing):
                 func_name = thing_name.split(".")[0]   # remove ".overload"
                 functions.append((func_name, thing))
-            elif type(type(thing)) is EnumMeta:
+            elif type(thing_type) is EnumMeta:
                 # take the real enum name, not what is in the dict
                 if not thing_name.startswith("_"):
-                    enums.append((thing_name, type(thing).__qualname__, thing))
+                    enums.append((thing_name, thing_type.__qualname__, thing))
             elif isinstance(thing, property):
                 properties.append((thing_name, thing))
             # Support attributes that have PySide types as values,
             # but we skip the 'staticMetaObject' that needs
             # to be defined at a QObject level.
-            elif "PySide" in str(type(thing)) and "QMetaObject" not in str(type(thing)):
+            elif ("PySide" in thing_type.__module__
+                  and "QMetaObject" not in thing_type.__qualname__):
                 if class_name not in attributes:
                     attributes[class_name] = {}
                 attributes[class_name][thing_name] = thing
@@ -177,15 +178,12 @@ class ExactEnumerator(object):
                 self.collision_track.add(thing_name)
 
         # PYSIDE-2846: Mark inconsistency between __iadd__ and __add__ etc.
-        for aug_ass in self.augmented_assignments:
-            if aug_ass in klass.__dict__:
-                other = self.augmented_assignments[aug_ass]
-                if other in klass.__dict__:
-                    aug_sig = self.get_signature(klass.__dict__[aug_ass])
-                    other_sig = self.get_signature(klass.__dict__[other])
-                    if aug_sig != other_sig:
-                        func = klass.__dict__[aug_ass]
-                        self.mypy_aug_ass_errors.add(func)
+        class_dict = klass.__dict__
+        for aug_ass, other in self.augmented_assignments.items():
+            if aug_ass in class_dict and other in class_dict:
+                func = class_dict[aug_ass]
+                if self.get_signature(func) != self.get_signature(class_dict[other]):
+                    self.mypy_aug_ass_errors.add(func)
 
         init_signature = getattr(klass, "__signature__", None)
         # PYSIDE-2752: Enums without values will not have a constructor, so
@@ -203,7 +201,9 @@ class ExactEnumerator(object):
         func_prop = sorted(functions + properties, key=lambda tup: tup[0])
 
         # find out how many functions create a signature
-        sigs = list(_ for _ in functions if get_sig(_[1]))
+        # Use the layout of this enumerator. Signatures are cached
+        # per layout in C, so function() will not compute them a second time.
+        sigs = list(_ for _ in functions if self.get_signature(_[1]))
         self.fmt.have_body = bool(subclasses or sigs or properties or enums or  # noqa W:504
                                   init_signature or signals or attributes)
 
@@ -213,14 +213,14 @@ class ExactEnumerator(object):
             self.fmt.class_name = class_name
             if hasattr(self.fmt, "enum"):
                 # this is an optional feature
-                if len(enums):
+                if enums:
                     self.section()
                 for enum_name, enum_class_name, value in enums:
                     with self.fmt.enum(enum_class_name, enum_name, value.value):
                         pass
             if hasattr(self.fmt, "signal"):
                 # this is an optional feature
-                if len(signals):
+                if signals:
                     self.section()
                 for signal_name, signal in signals:
                     sig_class = type(signal)
@@ -229,20 +229,19 @@ class ExactEnumerator(object):
                     with self.fmt.signal(sig_class_name, signal_name, sig_str):
                         pass
             if hasattr(self.fmt, "attribute"):
-                if len(attributes):
+                if attributes:
                     self.section()
                 for class_name, attrs in attributes.items():
                     for attr_name, attr_value in attrs.items():
                         with self.fmt.attribute(attr_name, attr_value):
                             pass
-            if len(subclasses):
+            if subclasses:
                 self.section()
-            for subclass_name, subclass in subclasses:
-                save = self.collision_track.copy()
-                ret.update(self.klass(subclass_name, subclass))
-                self.collision_track = save
-                self.fmt.class_name = class_name
-            if len(subclasses):
+                for subclass_name, subclass in subclasses:
+                    save = self.collision_track.copy()
+                    ret.update(self.klass(subclass_name, subclass))
+                    self.collision_track = save
+                    self.fmt.class_name = class_name
                 self.section()
             ret.update(self.function("__init__", klass))
             for func_name, func in func_prop:
@@ -252,7 +251,7 @@ class ExactEnumerator(object):
                     else:
                         ret.update(self.function(func_name, func))
             self.fmt.level -= 1
-            if len(func_prop):
+            if func_prop:
                 self.section()
         return ret
 
@@ -268,9 +267,9 @@ class ExactEnumerator(object):
         signature = self.get_signature(func, decorator)
         # PYSIDE-2846: Special cases of signatures which inherit from object.
         if func_name == "__dir__":
-            signature = inspect.Signature([], return_annotation=typing.Iterable[str])
+            signature = _DIR_SIGNATURE
         elif func_name == "__repr__":
-            signature = inspect.Signature([], return_annotation=str)
+            signature = _REPR_SIGNATURE
         if signature is not None:
             aug_ass = func in self.mypy_aug_ass_errors
             with self.fmt.function(func_name, signature, decorator, aug_ass) as key:
@@ -325,14 +324,12 @@ class HintingEnumerator(ExactEnumerator):
     hinting stubs. Only default values are replaced by "...".
     """
 
-    def __init__(self, *args, **kwds):
-        super().__init__(*args, **kwds)
-        # We need to provide default signatures for class properties.
-        cls_param = inspect.Parameter("cls", inspect._POSITIONAL_OR_KEYWORD)
-        set_param = inspect.Parameter("arg_1", inspect._POSITIONAL_OR_KEYWORD, annotation=object)
-        self.getter_sig = inspect.Signature([cls_param], return_annotation=object)
-        self.setter_sig = inspect.Signature([cls_param, set_param])
-        self.deleter_sig = inspect.Signature([cls_param])
+    # We need to provide default signatures for class properties.
+    _cls_param = inspect.Parameter("cls", inspect._POSITIONAL_OR_KEYWORD)
+    _set_param = inspect.Parameter("arg_1", inspect._POSITIONAL_OR_KEYWORD, annotation=object)
+    getter_sig = inspect.Signature([_cls_param], return_annotation=object)
+    setter_sig = inspect.Signature([_cls_param, _set_param])
+    deleter_sig = inspect.Signature([_cls_param])
 
     def get_signature(self, func, decorator=None):
         # Class properties don't have signature support (yet).
@@ -15,13 +15,12 @@ in sys.modules. This minimizes the loading overhead.
 """
 
 import os
-import struct
 import sys
 import typing
+import weakref
 
-from pathlib import Path
+from functools import lru_cache
 from typing import TypeVar, Generic
-from _imp import is_builtin
 
 
 class ellipsis(object):
@@ -33,6 +32,8 @@ ellipsis = ellipsis()
 Point = typing.Tuple[int, int]
 Variant = typing.Any
 QImageCleanupFunction = typing.Callable[..., typing.Any]
+# The buffer types which are accepted for all kinds of char arrays.
+PyBufferLike = typing.Union[bytes, bytearray, memoryview]
 
 # unfortunately, typing.Optional[t] expands to typing.Union[t, NoneType]
 # Until we can force it to create Optional[t] again, we use this.
@@ -48,7 +49,8 @@ _S = TypeVar("_S")
 MultiMap = typing.DefaultDict[str, typing.List[str]]
 
 # ulong_max is only 32 bit on windows.
-ulong_max = 2 * sys.maxsize + 1 if len(struct.pack("L", 1)) != 4 else 0xffffffff
+_ulong_is_32bit = sys.maxsize.bit_length() < 33 or sys.platform == "win32"
+ulong_max = 0xffffffff if _ulong_is_32bit else 2 * sys.maxsize + 1
 ushort_max = 0xffff
 
 GL_COLOR_BUFFER_BIT = 0x00004000
@@ -60,6 +62,15 @@ WId = int
 GL_TEXTURE_2D = 0x0DE1
 GL_RGBA = 0x1908
 
+namespace = globals()  # our module's __dict__
+
+
+@lru_cache(maxsize=512)
+def _compile_expression(text):
+    if not text.endswith(")"):
+        text += "()"
+    return compile(text, "<_NotCalled>", "eval")
+
 
 class _NotCalled(str):
     """
@@ -80,9 +91,9 @@ class _NotCalled(str):
         return f"{type(self).__name__}({self})"
 
     def __call__(self):
-        from shibokensupport.signature.mapping import __dict__ as namespace
-        text = self if self.endswith(")") else self + "()"
-        return eval(text, namespace)
+        # Only the compiled code is cached: the namespace changes while
+        # modules are loaded, so the result must be evaluated each time.
+        return eval(_compile_expression(str(self)), namespace)
 
 
 USE_PEP563 = False
@@ -144,48 +155,90 @@ class ArrayLikeVariable(_Parameterized):
 StringList = ArrayLikeVariable(str)
 
 
-class Reloader(object):
-    """
-    Reloder class
+# The builtin modules are fixed when the interpreter starts.
+_BUILTIN_MODULE_NAMES = frozenset(sys.builtin_module_names)
+
+# Modules with these file endings are not binary modules.
+_SOURCE_SUFFIXES = frozenset((".py", ".pyc", ".pyo", ".pyi"))
+
+# The verdicts of module_valid. The modules are weak keys, so removed
+# modules are not kept alive by the cache.
+_module_validity = weakref.WeakKeyDictionary()
+
+# The state of update_mapping: The size of sys.modules at the last call and
+# the binary modules which were already handled, by name. The values are
+# weak, so a module that was removed or replaced is handled again.
+_sys_module_count = 0
+_processed_modules = weakref.WeakValueDictionary()
+
+# The container types resolved by the parser, keyed by (text, var_handler).
+# They are built from type_map entries, so they are dropped whenever an
+# init function changes type_map.
+_container_cache = {}
+
+
+def module_valid(mod):
+    try:
+        return _module_validity[mod]
+    except (KeyError, TypeError):
+        # TypeError: sys.modules may contain None or objects without weakref support.
+        pass
+    file_name = getattr(mod, "__file__", None)
+    if not file_name:
+        valid = getattr(mod, "__name__", None) in _BUILTIN_MODULE_NAMES
+    else:
+        # Only a name without a suffix can be a directory, so the stat
+        # call is needed for those alone.
+        suffix = os.path.splitext(file_name)[1]
+        if suffix:
+            valid = suffix not in _SOURCE_SUFFIXES
+        else:
+            valid = not os.path.isdir(file_name)
+    try:
+        _module_validity[mod] = valid
+    except TypeError:
+        pass
+    return valid
 
-    This is a singleton class which provides the update function for the
-    shiboken and PySide classes.
+
+def update_mapping():
+    """
+    'update_mapping' imports all binary modules which are already in sys.modules.
+    The reason is to follow all user imports without introducing new ones.
+    This function is called by pyside_type_init to adapt imports
+    when the number of imported modules has changed.
     """
-    def __init__(self):
-        self.sys_module_count = 0
-
-    @staticmethod
-    def module_valid(mod):
-        if getattr(mod, "__file__", None) and not Path(mod.__file__).is_dir():
-            ending = Path(mod.__file__).suffix
-            return ending not in (".py", ".pyc", ".pyo", ".pyi")
-        return bool(hasattr(mod, "__name__") and is_builtin(mod.__name__))
-
-    def update(self):
-        """
-        'update' imports all binary modules which are already in sys.modules.
-        The reason is to follow all user imports without introducing new ones.
-        This function is called by pyside_type_init to adapt imports
-        when the number of imported modules has changed.
-        """
-        if self.sys_module_count == len(sys.modules):
-            return
-        self.sys_module_count = len(sys.modules)
-        g = globals()
-        # PYSIDE-1009: Try to recognize unknown modules in errorhandler.py
-        candidates = list(mod_name for mod_name in sys.modules.copy()
-                          if self.module_valid(sys.modules[mod_name]))
-        for mod_name in candidates:
-            # 'top' is PySide6 when we do 'import PySide.QtCore'
-            # or Shiboken if we do 'import Shiboken'.
-            # Convince yourself that these two lines below have the same
-            # global effect as "import Shiboken" or "import PySide6.QtCore".
-            top = __import__(mod_name)
-            g[top.__name__] = top
-            proc_name = "init_" + mod_name.replace(".", "_")
-            if proc_name in g:
-                # Modules are in place, we can update the type_map.
-                g.update(g.pop(proc_name)())
+    global _sys_module_count
+    modules = sys.modules
+    if _sys_module_count == len(modules):
+        return
+    _sys_module_count = len(modules)
+    processed = _processed_modules
+    g = globals()
+    # PYSIDE-1009: Try to recognize unknown modules in errorhandler.py
+    # Only modules which were not handled before need to be looked at.
+    # The order of sys.modules is kept, since the init functions build
+    # upon each other.
+    candidates = list(mod_name for mod_name, mod in tuple(modules.items())
+                      if processed.get(mod_name) is not mod
+                      and module_valid(mod))
+    for mod_name in candidates:
+        # 'top' is PySide6 when we do 'import PySide.QtCore'
+        # or Shiboken if we do 'import Shiboken'.
+        # Convince yourself that these two lines below have the same
+        # global effect as "import Shiboken" or "import PySide6.QtCore".
+        top = __import__(mod_name)
+        g[top.__name__] = top
+        proc_name = "init_" + mod_name.replace(".", "_")
+        if proc_name in g:
+            # Modules are in place, we can update the type_map.
+            g.update(g.pop(proc_name)())
+            _container_cache.clear()
+        try:
+            processed[mod_name] = modules[mod_name]
+        except (KeyError, TypeError):
+            # Gone meanwhile, or not weak referenceable: look at it again next time.
+            pass
 
 
 def check_module(mod):
@@ -193,16 +246,12 @@ def check_module(mod):
     # although the '*.so' was not yet created. This causes a problem
     # in Python 3, because it accepts folders as namespace modules
     # without enforcing an '__init__.py'.
-    if not Reloader.module_valid(mod):
+    if not module_valid(mod):
         mod_name = mod.__name__
         raise ImportError(f"Module '{mod_name}' is not a binary module!")
 
 
-update_mapping = Reloader().update
-type_map = {}
-namespace = globals()  # our module's __dict__
-
-type_map.update({
+type_map = {
     "...": ellipsis,
     "Any": typing.Any,
     "bool": bool,
@@ -253,7 +302,6 @@ type_map.update({
     "QStringList": StringList,
     "quint16": int,
     "quint32": int,
-    "quint32": int,
     "quint64": int,
     "quint8": int,
     "uint16_t": int,
@@ -281,13 +329,11 @@ type_map.update({
     "true": True,
     "Tuple": typing.Tuple,
     "uchar": int,
-    "uchar*": str,
     "uint": int,
     "ulong": int,
     "ULONG_MAX": ulong_max,
     "UINT64_MAX": 0xffffffff,
     "unsigned char": int,  # 5.9
-    "unsigned char*": str,
     "unsigned int": int,
     "unsigned long int": int,  # 5.6, RHEL 6.6
     "unsigned long long": int,
@@ -309,9 +355,7 @@ type_map.update({
     "numpy.ndarray": typing.List[typing.Any],
     "std.array[int, 4]": typing.List[int],
     "std.array[float, 4]": typing.List[float],
-})
 
-type_map.update({
     # Handling variables declared as array:
     "array double*"         : ArrayLikeVariable(float),
     "array float*"          : ArrayLikeVariable(float),
@@ -321,8 +365,8 @@ type_map.update({
     "array long long*"      : ArrayLikeVariable(int),
     "array long*"           : ArrayLikeVariable(int),
     "array short*"          : ArrayLikeVariable(int),
-    "array signed char*"    : typing.Union[bytes, bytearray, memoryview],
-    "array unsigned char*"  : typing.Union[bytes, bytearray, memoryview],
+    "array signed char*"    : PyBufferLike,
+    "array unsigned char*"  : PyBufferLike,
     "array unsigned int*"   : ArrayLikeVariable(int),
     "array unsigned short*" : ArrayLikeVariable(int),
     # PYSIDE-1646: New macOS primitive types
@@ -333,19 +377,15 @@ type_map.update({
     "array int32_t*"        : ArrayLikeVariable(int),
     "array uint32_t*"       : ArrayLikeVariable(int),
     "array intptr_t*"       : ArrayLikeVariable(int),
-})
 
-type_map.update({
     # Special cases:
-    "char*"         : typing.Union[bytes, bytearray, memoryview],
-    "QChar*"        : typing.Union[bytes, bytearray, memoryview],
+    "char*"         : PyBufferLike,
+    "QChar*"        : PyBufferLike,
     "quint32*"      : int,        # only for QRandomGenerator
     "quint8*"       : bytearray,  # only for QCborStreamReader and QCborValue
-    "uchar*"        : typing.Union[bytes, bytearray, memoryview],
-    "unsigned char*": typing.Union[bytes, bytearray, memoryview],
-})
+    "uchar*"        : PyBufferLike,
+    "unsigned char*": PyBufferLike,
 
-type_map.update({
     # Handling variables that are returned, eventually as Tuples:
     "PySide6.QtQml.atomic[bool]": ResultVariable(bool),  # QmlIncubationController::incubateWhile()
     "bool*"         : ResultVariable(bool),
@@ -365,27 +405,19 @@ type_map.update({
     "uint*"         : ResultVariable(int),
     "unsigned int*" : ResultVariable(int),
     "QStringList*"  : ResultVariable(StringList),
-})
-
 
-type_map.update({
     # Hack, until improving the parser:
     "[typing.Any]"  : [typing.Any],
     "[typing.Any,typing.Any]"  : [typing.Any, typing.Any],
     "None" : None,
-})
-
 
-# PYSIDE-1328: We need to handle "self" explicitly.
-type_map.update({
+    # PYSIDE-1328: We need to handle "self" explicitly.
     "self" : "self",
     "cls"  : "cls",
-})
 
-# PYSIDE-1538: We need to treat "std::optional" accordingly.
-type_map.update({
+    # PYSIDE-1538: We need to treat "std::optional" accordingly.
     "std.optional": typing.Optional,
-    })
+}
 
 
 # The Shiboken Part
@@ -408,12 +440,10 @@ def init_minimal():
 def init_sample():
     import datetime
     type_map.update({
-        "char": int,
         "char**": typing.List[str],
         "const char*": str,
         "Complex": complex,
-        "double": float,
-        "ByteArray&": typing.Union[bytes, bytearray, memoryview],
+        "ByteArray&": PyBufferLike,
         "Foo.HANDLE": int,
         "HANDLE": int,
         "Null": None,
@@ -421,7 +451,7 @@ def init_sample():
         "OddBool": bool,
         "PStr": str,
         "PyDate": datetime.date,
-        "PyBuffer": typing.Union[bytes, bytearray, memoryview],
+        "PyBuffer": PyBufferLike,
         "sample.bool": bool,
         "sample.char": int,
         "sample.double": float,
@@ -435,7 +465,6 @@ def init_sample():
         "SampleNamespace.InValue.ZeroIn": 0,
         "sample.unsigned char": int,
         "std.size_t": int,
-        "std.string": str,
         "ZeroIn": 0,
         'Str("<unk")': "<unk",
         'Str("<unknown>")': "<unknown>",
@@ -479,7 +508,7 @@ def init_PySide6_QtCore():
     except ImportError:
         pass
 
-    type_map.update({
+    entries = {
         "' '": " ",
         "'%'": "%",
         "'g'": "g",
@@ -489,15 +518,13 @@ def init_PySide6_QtCore():
         "DescriptorType(-1)": int,  # Native handle of QSocketDescriptor
         "false": False,
         "list of QAbstractAnimation": typing.List[PySide6.QtCore.QAbstractAnimation],
-        "long long": int,
         "size_t": int,
         "NULL": None,  # 5.6, MSVC
-        "nullptr": None,  # 5.9
         # PYSIDE-2517: findChild/findChildren type hints:
         "PlaceHolderType": typing.TypeVar("PlaceHolderType", bound=PySide6.QtCore.QObject),
-        "PyBuffer": typing.Union[bytes, bytearray, memoryview],
+        "PyBuffer": PyBufferLike,
         "PyByteArray": bytearray,
-        "PyBytes": typing.Union[bytes, bytearray, memoryview],
+        "PyBytes": PyBufferLike,
         "PyTuple": typing.Tuple,
         "QDeadlineTimer.Forever": PySide6.QtCore.QDeadlineTimer.ForeverConstant.Forever,
         "QDeadlineTimer(QDeadlineTimer.Forever)": Instance("PySide6.QtCore.QDeadlineTimer"),
@@ -527,7 +554,6 @@ def init_PySide6_QtCore():
         "Flag.Default": Instance("PySide6.QtCore.QStringConverterBase.Flags"),
         "QStringList()": [],
         "QStringRef": str,
-        "QStringRef": str,
         "Qt.HANDLE": int,  # be more explicit with some constants?
         "QUrl.FormattingOptions(PrettyDecoded)": Instance(
             "QUrl.FormattingOptions(QUrl.PrettyDecoded)"),
@@ -535,19 +561,19 @@ def init_PySide6_QtCore():
         "QVariant.Type": type,  # not so sure here...
         "QVariantMap": typing.Dict[str, Variant],
         "std.chrono.seconds{5}" : ellipsis,
-    })
+        # special case - char* can either be 'bytes' or 'str'. The default is 'bytes'.
+        # Here we manually set it to map to 'str'.
+        ("PySide6.QtCore.QObject.setProperty", "char*"): str,
+        ("PySide6.QtCore.QObject.property", "char*"): str,
+    }
     try:
-        type_map.update({
-            "PySide6.QtCore.QMetaObject.Connection": PySide6.QtCore.Connection,  # wrong!
-        })
+        entries["PySide6.QtCore.QMetaObject.Connection"] = PySide6.QtCore.Connection  # wrong!
     except AttributeError:
         # this does not exist on 5.9 ATM.
         pass
-
-    # special case - char* can either be 'bytes' or 'str'. The default is 'bytes'.
-    # Here we manually set it to map to 'str'.
-    type_map.update({("PySide6.QtCore.QObject.setProperty", "char*"): str})
-    type_map.update({("PySide6.QtCore.QObject.property", "char*"): str})
+    type_map.update(entries)
+    # Keep the returned namespace free of the helper dict.
+    del entries
 
     return locals()
 
@@ -569,7 +595,6 @@ def init_PySide6_QtGui():
         "1.0f": 1.0,
         "GL_COLOR_BUFFER_BIT": GL_COLOR_BUFFER_BIT,
         "GL_NEAREST": GL_NEAREST,
-        "int32_t": int,
         "HBITMAP": int,
         "HICON": int,
         "HMONITOR": int,
@@ -577,8 +602,6 @@ def init_PySide6_QtGui():
         "QPixmap()": Default("PySide6.QtGui.QPixmap"),  # can't create without qApp
         "QPlatformSurface*": int,  # a handle
         "QVector< QTextLayout.FormatRange >()": [],  # do we need more structure?
-        "uint32_t": int,
-        "uint8_t": int,
         "USHRT_MAX": ushort_max,
     })
 
@@ -620,16 +643,14 @@ def init_PySide6_QtSql():
 
 def init_PySide6_QtNetwork():
     from PySide6.QtNetwork import QNetworkRequest, QHostAddress
-    best_structure = typing.OrderedDict if getattr(typing, "OrderedDict", None) else typing.Dict
     type_map.update({
         "QMultiMap[PySide6.QtNetwork.QSsl.AlternativeNameEntryType, QString]":
-            best_structure[PySide6.QtNetwork.QSsl.AlternativeNameEntryType, typing.List[str]],
+            typing.OrderedDict[PySide6.QtNetwork.QSsl.AlternativeNameEntryType, typing.List[str]],
         "DefaultTransferTimeoutConstant":
             QNetworkRequest.TransferTimeoutConstant,
         "QNetworkRequest.DefaultTransferTimeoutConstant":
             QNetworkRequest.TransferTimeoutConstant,
     })
-    del best_structure
     return locals()
 
 
@@ -11,9 +11,10 @@ import sys
 import typing
 import warnings
 
-from types import SimpleNamespace
+from functools import lru_cache
 from shibokensupport.signature.mapping import (type_map, update_mapping,
-    namespace, _NotCalled, ResultVariable, ArrayLikeVariable)  # noqa E:128
+    namespace, _NotCalled, ResultVariable, ArrayLikeVariable,  # noqa E:128
+    _container_cache)  # noqa E:128
 from shibokensupport.signature.lib.tool import build_brace_pattern
 
 _DEBUG = False
@@ -106,7 +107,32 @@ def dprint(*args, **kw):
             sys.stdout.flush()
 
 
-_cache = {}
+# The regular expressions are compiled once, when the module is loaded.
+_ARGLIST_SPLIT_RE = re.compile(build_brace_pattern(level=3, separators=","), flags=re.VERBOSE)
+_LINE_RE = re.compile(r"""
+    ((?P<multi> ([0-9]+)) : )?    # the optional multi-index
+    (?P<funcname> \w+(\.\w+)*)    # the function name
+    \( (?P<arglist> .*?) \)       # the argument list
+    ( -> (?P<returntype> .*) )?   # the optional return type
+    $
+    """, flags=re.VERBOSE)
+_INSTANCE_RE = re.compile(r"\w+\(")
+_ARRAY_RE = re.compile(r"\[(\d*)\]$")
+_CONTAINER_RE = re.compile(r"(.*?)\[(.*?)\]$")
+_UPPER_RE = re.compile(r"[A-Z]")
+_TWO_UPPER_RE = re.compile(r"[A-Z]{2}")
+
+_GLOBALS = globals()
+
+
+@lru_cache(maxsize=4096)
+def _compile_expression(text):
+    return compile(text, "<signature>", "eval")
+
+
+def _eval(text):
+    # PYSIDE-1735: Use explicit globals and locals because of a bug in VsCode
+    return eval(_compile_expression(text), _GLOBALS, namespace)
 
 
 def _parse_arglist(argstr):
@@ -114,58 +140,41 @@ def _parse_arglist(argstr):
     # between the recognized strings. Because the re has groups, both the
     # strings and the separators are returned, where the strings are not
     # interesting at all: They are just the commata.
-    key = "_parse_arglist"
-    if key not in _cache:
-        regex = build_brace_pattern(level=3, separators=",")
-        _cache[key] = re.compile(regex, flags=re.VERBOSE)
-    split = _cache[key].split
     # Note: this list is interspersed with "," and surrounded by ""
-    return [x.strip() for x in split(argstr) if x.strip() not in ("", ",")]
+    return [x.strip() for x in _ARGLIST_SPLIT_RE.split(argstr) if x.strip() not in ("", ",")]
 
 
 def _parse_line(line):
-    line_re = r"""
-        ((?P<multi> ([0-9]+)) : )?    # the optional multi-index
-        (?P<funcname> \w+(\.\w+)*)    # the function name
-        \( (?P<arglist> .*?) \)       # the argument list
-        ( -> (?P<returntype> .*) )?   # the optional return type
-        $
-        """
-    matches = re.match(line_re, line, re.VERBOSE)
+    matches = _LINE_RE.match(line)
     if not matches:
         raise SystemError("Error parsing line:", repr(line))
-    ret = SimpleNamespace(**matches.groupdict())
+    ret = matches.groupdict()
     # PYSIDE-1095: Handle arbitrary default expressions
-    argstr = ret.arglist.replace("->", ".deref.")
+    argstr = ret["arglist"].replace("->", ".deref.")
     arglist = _parse_arglist(argstr)
     args = []
     for idx, arg in enumerate(arglist):
-        tokens = arg.split(":")
-        if len(tokens) < 2 and idx == 0 and tokens[0] in ("self", "cls"):
-            tokens = 2 * tokens     # "self: self"
-        if len(tokens) != 2:
+        name, colon, ann = arg.partition(":")
+        if not colon and idx == 0 and name in ("self", "cls"):
+            colon, ann = ":", name  # "self: self"
+        if not colon or ":" in ann:
             # This should never happen again (but who knows?)
             raise SystemError(f'Invalid argument "{arg}" in "{line}".')
-        name, ann = tokens
-        if name in keyword.kwlist:
+        if keyword.iskeyword(name):
             if LIST_KEYWORDS:
                 print("KEYWORD", ret)
             name = name + "_"
-        if "=" in ann:
-            ann, default = ann.split("=", 1)
-            tup = name, ann, default
-        else:
-            tup = name, ann
-        args.append(tup)
-    ret.arglist = args
-    multi = ret.multi
+        ann, equal, default = ann.partition("=")
+        args.append((name, ann, default) if equal else (name, ann))
+    ret["arglist"] = args
+    multi = ret["multi"]
     if multi is not None:
-        ret.multi = int(multi)
-    funcname = ret.funcname
+        ret["multi"] = int(multi)
+    funcname = ret["funcname"]
     parts = funcname.split(".")
-    if parts[-1] in keyword.kwlist:
-        ret.funcname = funcname + "_"
-    return vars(ret)
+    if keyword.iskeyword(parts[-1]):
+        ret["funcname"] = funcname + "_"
+    return ret
 
 
 def _using_snake_case():
@@ -186,7 +195,7 @@ def _handle_instance_fixup(thing):
         QKeyCombination.fromCombined(0)
         QSslConfiguration.defaultConfiguration()
     """
-    match = re.search(r"\w+\(", thing)
+    match = _INSTANCE_RE.search(thing)
     if not match:
         return thing
     start, stop = match.start(), match.end() - 1
@@ -194,15 +203,10 @@ def _handle_instance_fixup(thing):
     if func[0].isupper() or func.startswith("gl") and func[2:3].isupper():
         return thing
     # Now convert this string to snake case.
-    snake_func = ""
-    for idx, char in enumerate(func):
-        if char.isupper():
-            if idx and func[idx - 1].isupper():
-                # two upper chars are forbidden
-                return thing
-            snake_func += f"_{char.lower()}"
-        else:
-            snake_func += char
+    if _TWO_UPPER_RE.search(func):
+        # two upper chars are forbidden
+        return thing
+    snake_func = _UPPER_RE.sub(lambda match: f"_{match.group().lower()}", func)
     return f"{pre}{snake_func}{args}"
 
 
@@ -214,11 +218,11 @@ def make_good_value(thing, valtype):
         if thing.endswith("()"):
             thing = f'Default("{thing[:-2]}")'
         else:
-            # PYSIDE-1735: Use explicit globals and locals because of a bug in VsCode
-            ret = eval(thing, globals(), namespace)
-            if valtype and repr(ret).startswith("<"):
-                thing = f'Instance("{thing}")'
-        return eval(thing, globals(), namespace)
+            ret = _eval(thing)
+            if not (valtype and repr(ret).startswith("<")):
+                return ret
+            thing = f'Instance("{thing}")'
+        return _eval(thing)
     except Exception:
         pass
 
@@ -277,17 +281,18 @@ def _resolve_value(thing, valtype, line):
 
 
 def _resolve_arraytype(thing, line):
-    search = re.search(r"\[(\d*)\]$", thing)
-    thing = thing[:search.start()]
-    if thing.endswith("]"):
-        thing = _resolve_arraytype(thing, line)
-    if search.group(1):
-        # concrete array, use a tuple
-        nelem = int(search.group(1))
-        thing = ", ".join([thing] * nelem)
-        thing = "Tuple[" + thing + "]"
-    else:
-        thing = "QList[" + thing + "]"
+    # Collect the dimensions from right to left, then wrap the element
+    # type starting with the innermost (leftmost) dimension.
+    dims = []
+    while (search := _ARRAY_RE.search(thing)):
+        dims.append(search.group(1))
+        thing = thing[:search.start()]
+    for dim in reversed(dims):
+        if dim:
+            # concrete array, use a tuple
+            thing = "Tuple[" + ", ".join([thing] * int(dim)) + "]"
+        else:
+            thing = "QList[" + thing + "]"
     return thing
 
 
@@ -302,13 +307,16 @@ def to_string(thing):
     # so we fall back to use __name__ before the next condition.
     if isinstance(thing, typing.TypeVar):
         return get_name(thing)
-    if hasattr(thing, "__name__") and thing.__module__ != "typing":
+    if hasattr(thing, "__name__"):
         m = thing.__module__
-        dot = "." in str(thing) or m not in (thing.__qualname__, "builtins")
-        name = get_name(thing)
-        ret = m + "." + name if dot else name
-        assert (eval(ret, globals(), namespace))
-        return ret
+        if m != "typing":
+            dot = "." in str(thing) or m not in (thing.__qualname__, "builtins")
+            name = get_name(thing)
+            ret = m + "." + name if dot else name
+            if _DEBUG:
+                # Verify the round trip, only while debugging the parser.
+                assert (_eval(ret))
+            return ret
     # Note: This captures things from the typing module:
     return str(thing)
 
@@ -320,7 +328,7 @@ def handle_matrix(arg):
     n, m, typstr = tuple(map(lambda x: x.strip(), arg.split(",")))
     assert typstr == "float"
     result = f"PySide6.QtGui.QMatrix{n}x{m}"
-    return eval(result, globals(), namespace)
+    return _eval(result)
 
 
 def _resolve_type(thing, line, level, var_handler, func_name=None):
@@ -340,11 +348,14 @@ def _resolve_type(thing, line, level, var_handler, func_name=None):
         # Special case: Callable[[],
         if thing == "[]":
             return thing
+        cache_key = thing, var_handler
+        if cache_key in _container_cache:
+            return _container_cache[cache_key]
         # handle primitive arrays
-        if re.search(r"\[\d*\]$", thing):
+        if _ARRAY_RE.search(thing):
             thing = _resolve_arraytype(thing, line)
         # Handle a container return type. (see PYSIDE-921 in cppgenerator.cpp)
-        contr, thing = re.match(r"(.*?)\[(.*?)\]$", thing).groups()
+        contr, thing = _CONTAINER_RE.match(thing).groups()
         # Special case: Handle the generic matrices.
         if contr == matrix_pattern:
             return handle_matrix(thing)
@@ -363,13 +374,16 @@ def _resolve_type(thing, line, level, var_handler, func_name=None):
         result = f"{contr}[{thing}]"
         # PYSIDE-1538: Make sure that the eval does not crash.
         try:
-            return eval(result, globals(), namespace)
+            res = _eval(result)
         except Exception:
             warnings.warn(f"""pyside_type_init:_resolve_type
 
                 UNRECOGNIZED:   {result!r}
                 OFFENDING LINE: {line!r}
                 """, RuntimeWarning)
+        else:
+            _container_cache[cache_key] = res
+            return res
     return _resolve_value(thing, None, line)
 
 
@@ -419,10 +433,14 @@ class Hashabledict(dict):
 
 
 def calculate_props(line):
-    parsed = SimpleNamespace(**_parse_line(line.strip()))
-    arglist = parsed.arglist
+    parsed = _parse_line(line.strip())
+    arglist = parsed["arglist"]
+    funcname = parsed["funcname"]
     annotations = {}
     _defaults = []
+    # Many arguments of a line share annotations and defaults: resolve each once.
+    resolved_annotations = {}
+    resolved_defaults = {}
     for idx, tup in enumerate(arglist):
         name, ann = tup[:2]
         if ann == "...":
@@ -431,16 +449,21 @@ def calculate_props(line):
             ann = 'nullptr'     # maps to None
             tup = name, ann
             arglist[idx] = tup
-        annotations[name] = _resolve_type(ann, line, 0, handle_argvar, parsed.funcname)
+        if ann not in resolved_annotations:
+            resolved_annotations[ann] = _resolve_type(ann, line, 0, handle_argvar, funcname)
+        annotations[name] = resolved_annotations[ann]
         if len(tup) == 3:
-            default = _resolve_value(tup[2], ann, line)
-            # PYSIDE-2846: When creating signatures, the defaults should be hashable.
-            #              For that to work, we use `Hashabledict`.
-            if type(default) is dict:
-                default = Hashabledict(default)
-            _defaults.append(default)
+            key = ann, tup[2]
+            if key not in resolved_defaults:
+                default = _resolve_value(tup[2], ann, line)
+                # PYSIDE-2846: When creating signatures, the defaults should be hashable.
+                #              For that to work, we use `Hashabledict`.
+                if type(default) is dict:
+                    default = Hashabledict(default)
+                resolved_defaults[key] = default
+            _defaults.append(resolved_defaults[key])
     defaults = tuple(_defaults)
-    returntype = parsed.returntype
+    returntype = parsed["returntype"]
     if isinstance(returntype, str) and returntype.startswith("("):
         # PYSIDE-1588: Simplify the handling of returned tuples for now.
         # Later we might create named tuples, instead.
@@ -448,21 +471,20 @@ def calculate_props(line):
     # PYSIDE-1383: We need to handle `None` explicitly.
     annotations["return"] = (_resolve_type(returntype, line, 0, handle_retvar)
                              if returntype is not None else None)
-    props = SimpleNamespace()
-    props.defaults = defaults
-    props.kwdefaults = {}
-    props.annotations = annotations
-    props.varnames = tuple(tup[0] for tup in arglist)
-    funcname = parsed.funcname
-    shortname = funcname[funcname.rindex(".") + 1:]
-    props.name = shortname
-    props.multi = parsed.multi
+    props = {
+        "defaults": defaults,
+        "kwdefaults": {},
+        "annotations": annotations,
+        "varnames": tuple(tup[0] for tup in arglist),
+        "name": funcname[funcname.rindex(".") + 1:],
+        "multi": parsed["multi"],
+    }
     fix_variables(props, line)
-    return vars(props)
+    return props
 
 
 def fix_variables(props, line):
-    annos = props.annotations
+    annos = props["annotations"]
     if not any(isinstance(ann, (ResultVariable, ArrayLikeVariable))
                for ann in annos.values()):
         return
@@ -470,8 +492,8 @@ def fix_variables(props, line):
     if retvar and isinstance(retvar, (ResultVariable, ArrayLikeVariable)):
         # Special case: a ResultVariable which is the result will always be an array!
         annos["return"] = retvar = typing.List[retvar.type]
-    varnames = list(props.varnames)
-    defaults = list(props.defaults)
+    varnames = list(props["varnames"])
+    defaults = list(props["defaults"])
     diff = len(varnames) - len(defaults)
 
     safe_annos = annos.copy()
@@ -504,18 +526,22 @@ def fix_variables(props, line):
                        for rv in retvars)
         if len(retvars) == 1:
             returntype = retvars[0]
+        elif not any(isinstance(rv, str) for rv in retvars):
+            returntype = typing.Tuple[tuple(retvars)]
         else:
+            # Types given as text must be evaluated in the mapping namespace.
             retvars_str = ", ".join(map(to_string, retvars))
             typestr = f"typing.Tuple[{retvars_str}]"
-            returntype = eval(typestr, globals(), namespace)
-        props.annotations["return"] = returntype
-    props.varnames = tuple(varnames)
-    props.defaults = tuple(defaults)
+            returntype = _eval(typestr)
+        annos["return"] = returntype
+    props["varnames"] = tuple(varnames)
+    props["defaults"] = tuple(defaults)
 
 
 def pyside_type_init(type_key, sig_strings):
-    dprint()
-    dprint(f"Initialization of type key '{type_key}'")
+    if _DEBUG:
+        dprint()
+        dprint(f"Initialization of type key '{type_key}'")
     update_mapping()
     ret = {}
     multi_props = []
@@ -29,6 +29,7 @@ init_paths()
 from sample import IntArray2, VirtualMethods
 
 from shibokensupport.signature import get_signature
+from shibokensupport.signature.mapping import type_map, PyBufferLike
 
 import typing
 
@@ -52,6 +53,11 @@ class PointerPrimitiveTypeTest(unittest.TestCase):
         ann = get_signature(VirtualMethods.getMargins).return_annotation
         self.assertEqual(ann, typing.Tuple[int, int, int, int])
 
+    def testBufferTypesAreShared(self):
+        # All char buffers map to the one PyBufferLike alias.
+        for name in ("char*", "uchar*", "unsigned char*", "array unsigned char*"):
+            self.assertIs(type_map[name], PyBufferLike)
+
 
 if __name__ == '__main__':
     unittest.main()
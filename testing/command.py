@@ -96,7 +96,7 @@ def test_project(project, args, blacklist, runs):
                     break
             else:
                 rerun = None
-            runner.run(f"RUN {idx + 1}:", rerun, TIMEOUT)
+            runner.run(f"RUN {idx + 1}:", rerun, TIMEOUT, args.jobs)
         results = TestParser(runner.logfile)
         r = 5 * [0]
         rerun_list = []
@@ -185,6 +185,13 @@ def main():
         choices=all_projects,
         help=f"use {tested_projects_quoted} (default) or other projects",
     )
+    parser_test.add_argument(
+        "--jobs",
+        "-j",
+        default=1,
+        type=int,
+        help="run n tests in parallel (default: 1, 0 = number of CPUs)",
+    )
     parser_getcwd = subparsers.add_parser("getcwd")
     parser_getcwd.add_argument(
         "filename", type=argparse.FileType("w"), help="write the build dir name into a file"
@@ -224,6 +231,9 @@ def main():
         parser.print_help()
         sys.exit(1)
 
+    if args.jobs < 1:
+        args.jobs = os.cpu_count() or 1
+
     if args.blacklist:
         args.blacklist.close()
         bl = BlackList(args.blacklist.name)
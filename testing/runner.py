@@ -218,8 +218,11 @@ class TestRunner(object):
             print()
         tee_process.wait()
 
-    def run(self, label, rerun, timeout):
+    def run(self, label, rerun, timeout, jobs=1):
         cmd = self.ctestCommand, "--output-log", self.logfile
+        if jobs > 1:
+            # Every test runs in its own process; ctest schedules them.
+            cmd += ("--parallel", str(jobs))
         if rerun is not None:
             # cmd += ("--rerun-failed",)
             # For some reason, this worked never in the script file.